@@ -186,6 +186,9 @@ export class JSONFrameSerializer implements WebSocketSerializer {
       frameDict["transport_destination"] = frame.transport_destination;
     }
 
+    const bytesFields: string[] = [];
+    const tupleFields: string[] = [];
+
     // Get all fields from the frame object
     // In TypeScript/JavaScript, we iterate over own properties
     for (const key in frame) {
@@ -198,17 +201,24 @@ export class JSONFrameSerializer implements WebSocketSerializer {
         const value = frame[key];
         // Mark bytes fields for proper deserialization
         if (value instanceof Uint8Array) {
-          frameDict[`__${key}_is_bytes__`] = true;
+          bytesFields.push(key);
         }
         // Track tuple fields for proper restoration
         // In JavaScript, we don't have a native tuple type, but we can mark arrays that should be tuples
         if (Array.isArray(value) && (value as any).__isTuple__) {
-          frameDict[`__${key}_is_tuple__`] = true;
+          tupleFields.push(key);
         }
         frameDict[key] = this._serializeValue(value);
       }
     }
 
+    if (bytesFields.length > 0) {
+      frameDict["__bytes_fields__"] = bytesFields;
+    }
+    if (tupleFields.length > 0) {
+      frameDict["__tuple_fields__"] = tupleFields;
+    }
+
     return frameDict;
   }
 
@@ -230,6 +240,11 @@ export class JSONFrameSerializer implements WebSocketSerializer {
       // In TypeScript/JavaScript, we create a plain object with the frame's properties
       // We don't have dynamic module import like Python, so we reconstruct as a plain object
       const constructorArgs: Record<string, any> = {};
+      // Fields that were originally bytes / tuples
+      const bytesFields = new Set<string>(frameDict["__bytes_fields__"] || []);
+      const tupleFields = new Set<string>(frameDict["__tuple_fields__"] || []);
+      // Float lists packed as little-endian float64 buffers, keyed by field
+      const arrayFields: Record<string, string> = frameDict["__array_fields__"] || {};
 
       // Extract constructor arguments from the dict
       // Remove non-constructor fields
@@ -246,11 +261,11 @@ export class JSONFrameSerializer implements WebSocketSerializer {
           }
 
           const value = frameDict[key];
-          // Check if this field was originally bytes
-          const isBytesMarker = frameDict[`__${key}_is_bytes__`] || false;
-          // Check if this field was originally tuple
-          const isTupleMarker = frameDict[`__${key}_is_tuple__`] || false;
-          constructorArgs[key] = this._deserializeValue(value, isBytesMarker, isTupleMarker);
+          if (arrayFields[key] === "d") {
+            constructorArgs[key] = this._deserializeFloatArray(value, tupleFields.has(key));
+            continue;
+          }
+          constructorArgs[key] = this._deserializeValue(value, bytesFields.has(key), tupleFields.has(key));
         }
       }
 
@@ -291,6 +306,29 @@ export class JSONFrameSerializer implements WebSocketSerializer {
     }
   }
 
+  /**
+   * Unpack a base64 encoded little-endian float64 buffer into a number array.
+   *
+   * @param value - The base64 encoded buffer.
+   * @param isTuple - Whether the original value was tuple (for type restoration).
+   * @returns The unpacked numbers.
+   */
+  private _deserializeFloatArray(value: string, isTuple: boolean): number[] {
+    const binaryString = atob(value);
+    const view = new DataView(new ArrayBuffer(binaryString.length));
+    for (let i = 0; i < binaryString.length; i++) {
+      view.setUint8(i, binaryString.charCodeAt(i));
+    }
+    const numbers: number[] = [];
+    for (let offset = 0; offset + 8 <= view.byteLength; offset += 8) {
+      numbers.push(view.getFloat64(offset, true));
+    }
+    if (isTuple) {
+      (numbers as any).__isTuple__ = true;
+    }
+    return numbers;
+  }
+
   /**
    * Serialize a value to JSON-compatible format.
    *
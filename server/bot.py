@@ -20,8 +20,10 @@ Run the bot using::
     uv run bot.py
 """
 
+import binascii
 import os
 
+import pybase64
 from dotenv import load_dotenv
 from loguru import logger
 from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import LocalSmartTurnAnalyzerV3
@@ -47,7 +49,7 @@ from jarvis.qwen.tts import QwenTTSService
 from pipecat.adapters.schemas.function_schema import FunctionSchema
 from pipecat.adapters.schemas.tools_schema import ToolsSchema
 from jarvis.llm.image_analyzer import ImageAnalyzer
-from jarvis.serializer import JSONFrameSerializer
+from jarvis.serializer import JSONFrameSerializer, MsgPackFrameSerializer
 
 load_dotenv(override=True)
 
@@ -75,6 +77,21 @@ def load_system_prompt() -> str:
         return default_prompt
 
 
+def create_serializer():
+    """Create the websocket frame serializer selected by WEBSOCKET_SERIALIZER.
+
+    "json" (default) sends text frames with base64 payloads, which the web client
+    understands. "msgpack" sends binary frames with raw audio/image bytes; the
+    transport switches to send_bytes/receive_bytes on its own for binary serializers.
+    """
+    name = os.getenv("WEBSOCKET_SERIALIZER", "json").lower()
+    if name == "msgpack":
+        return MsgPackFrameSerializer()
+    if name != "json":
+        logger.warning(f"Unknown WEBSOCKET_SERIALIZER {name!r}, using json")
+    return JSONFrameSerializer()
+
+
 async def run_bot(websocket_client: FastAPIWebsocketClient):
     transport = FastAPIWebsocketTransport(
         websocket=websocket_client,
@@ -84,7 +101,7 @@ async def run_bot(websocket_client: FastAPIWebsocketClient):
             add_wav_header=False,
             vad_analyzer=SileroVADAnalyzer(),
             turn_analyzer=LocalSmartTurnAnalyzerV3(),
-            serializer=JSONFrameSerializer(),
+            serializer=create_serializer(),
         )
     )
 
@@ -248,7 +265,13 @@ async def run_bot(websocket_client: FastAPIWebsocketClient):
     async def on_client_message(_, msg: RTVIClientMessage):
         match msg.type:
             case 'pic-result':
-                image_analyzer.push_image(msg.data['uuid'], msg.data['data'])
+                try:
+                    uuid = msg.data['uuid']
+                    image = pybase64.b64decode(msg.data['data'])
+                except (binascii.Error, ValueError, KeyError, TypeError) as e:
+                    logger.warning(f'Dropping malformed pic-result: {e!r}')
+                    return
+                image_analyzer.push_image(uuid, image)
                 logger.info('Got pic-result, saved to cache')
             case _:
                 logger.info(f'Received unknown type of client message: {msg.type}')
@@ -272,4 +295,7 @@ async def run_bot(websocket_client: FastAPIWebsocketClient):
 
     runner = PipelineRunner(handle_sigint=False)
 
-    await runner.run(task)
+    try:
+        await runner.run(task)
+    finally:
+        await image_analyzer.aclose()
@@ -0,0 +1,13 @@
+"""Shared pytest configuration for the jarvis tests."""
+
+try:
+    import uvloop
+except ImportError:  # uvloop is only installed (via uvicorn[standard]) on non-Windows
+    uvloop = None
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        """Run the asyncio tests on uvloop, as the server does in production."""
+        return {"uvloop": uvloop.new_event_loop}
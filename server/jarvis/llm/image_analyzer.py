@@ -1,13 +1,21 @@
+from collections import OrderedDict
 from typing import Optional
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+import pybase64
 from pipecat.services.llm_service import FunctionCallParams
 from pipecat.services.ai_service import AIService
 from loguru import logger
 
+_JPEG_DATA_URL_PREFIX = "data:image/jpeg;base64,"
+
 
 class ImageAnalyzer:
     """Analyzes images using an OpenAI-compatible API."""
 
+    # Pictures pushed by the client but never asked about are evicted oldest-first
+    MAX_CACHED_PICTURES = 32
+
     def __init__(self, base_url: str, api_key: str, model: str):
         """Initialize the ImageAnalyzer with API credentials.
 
@@ -15,12 +23,35 @@ class ImageAnalyzer:
             base_url: The base URL for the OpenAI-compatible API endpoint.
             api_key: The API key for authentication.
         """
-        self._client = AsyncOpenAI(base_url=base_url, api_key=api_key)
+        # VL calls are minutes apart; keep the TLS connection warm between them
+        # instead of httpx's default 5 s keepalive
+        http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=16,
+                max_keepalive_connections=8,
+                keepalive_expiry=60,
+            ),
+        )
+        self._client = AsyncOpenAI(base_url=base_url, api_key=api_key, http_client=http_client)
         self._model = model
-        self._pic_cache = {}
+        self._pic_cache: OrderedDict[str, bytes] = OrderedDict()
+
+    def push_image(self, uuid: str, data: bytes):
+        """Cache a picture until a function call asks about it.
+
+        Args:
+            uuid: The id the LLM will refer to the picture by.
+            data: The raw JPEG bytes (not base64).
+        """
+        self._pic_cache[uuid] = data
+        self._pic_cache.move_to_end(uuid)
+        if len(self._pic_cache) > self.MAX_CACHED_PICTURES:
+            evicted, _ = self._pic_cache.popitem(last=False)
+            logger.warning(f"Picture cache full, dropped unused picture {evicted}")
 
-    def push_image(self, uuid: str, data: str):
-        self._pic_cache[uuid] = data 
+    async def aclose(self):
+        """Close the underlying HTTP connection pool."""
+        await self._client.close()
 
     async def handle_function_call(self, params: FunctionCallParams):
         """Handle a function call to analyze an image.
@@ -28,7 +59,7 @@ class ImageAnalyzer:
         Args:
             params: The function call parameters containing:
                 - prompts: The text prompt to send with the image
-                - image: The base64-encoded image data
+                - image_uuid: The id of a picture passed to `push_image`
                 - result_callback: Callback to return the analysis result
         """
         try:
@@ -39,12 +70,15 @@ class ImageAnalyzer:
                 await params.result_callback("Error: No image uuid provided")
                 return
             
-            image_data = self._pic_cache[image_uuid]
-            if not image_data:
+            image_bytes = self._pic_cache.pop(image_uuid, None)
+            if not image_bytes:
                 await params.result_callback("Error: image uuid not exist")
                 return
-            
-            del self._pic_cache[image_uuid]
+
+            # Build the data URL in one step and drop the raw bytes, so only the URL
+            # (and the request body built from it) is held during the API call
+            image_url = _JPEG_DATA_URL_PREFIX + pybase64.b64encode_as_string(image_bytes)
+            del image_bytes
 
             # Prepare the message with image content
             message = {
@@ -53,7 +87,7 @@ class ImageAnalyzer:
                     {"type": "text", "text": prompts},
                     {
                         "type": "image_url",
-                        "image_url": {"url": f"data:image/jpeg;base64,{image_data}"},
+                        "image_url": {"url": image_url},
                     },
                 ],
             }
@@ -1,27 +1,33 @@
 from loguru import logger
-import base64
+import pybase64
 
 from pipecat.services.stt_service import SegmentedSTTService
 from pipecat.frames.frames import AudioRawFrame, LLMMessagesAppendFrame
 
+_AUDIO_DATA_URL_PREFIX = 'data:;base64,'
+
+
+def _audio_message(audio: bytes) -> dict:
+    """Build the user message carrying one audio segment as a data URL."""
+    return {
+        'role': 'user',
+        'content': [
+            {
+                'type': 'input_audio',
+                'input_audio': {
+                    'data': _AUDIO_DATA_URL_PREFIX + pybase64.b64encode_as_string(audio),
+                    'format': 'wav',
+                }
+            }
+        ]
+    }
+
+
 class LLMVoiceMessageSTT(SegmentedSTTService):
     async def run_stt(self, audio):
         logger.info('convert audio frame to llm message')
         f = LLMMessagesAppendFrame(
-            messages=[
-                {
-                    'role': 'user',
-                    'content': [
-                        {
-                            'type': 'input_audio',
-                            'input_audio': {
-                                'data': f'data:;base64,{base64.b64encode(audio).decode()}',
-                                'format': 'wav',
-                            }
-                        }
-                    ]
-                }
-            ],
+            messages=[_audio_message(audio)],
             run_llm=True,
         )
         yield f
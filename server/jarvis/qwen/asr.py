@@ -7,11 +7,13 @@ from pipecat.utils.time import time_now_iso8601, seconds_to_nanoseconds
 from dashscope.audio.asr import *
 import dashscope
 import asyncio
-import wave
+import struct
 import bisect
+import threading
 import time
-from dataclasses import dataclass
-from typing import List, Optional, TYPE_CHECKING
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     pass
@@ -20,11 +22,11 @@ def time_now_ns() -> int:
     """Get the current time in nanoseconds.
     
     Returns:
-        The current time as nanoseconds since the Unix epoch.
+        The current value of the monotonic clock in nanoseconds.
     """
-    return int(time.time() * 1_000_000_000)
+    return time.monotonic_ns()
 
-@dataclass
+@dataclass(slots=True)
 class TimestampedAudioFrame:
     """带时间戳的音频帧包装器"""
     audio: bytes
@@ -32,49 +34,29 @@ class TimestampedAudioFrame:
     sample_rate: int
     num_channels: int
     num_frames: int
+    duration_ns: int = field(init=False)  # 帧时长（纳秒），构造时计算一次
+    
+    def __post_init__(self):
+        self.duration_ns = self.num_frames * 1_000_000_000 // self.sample_rate
     
     @classmethod
-    def from_audio_raw_frame(cls, frame: AudioRawFrame, last_pts: Optional[int] = None) -> 'TimestampedAudioFrame':
-        """从AudioRawFrame创建TimestampedAudioFrame"""
-        # 确保frame.pts是整数，如果是None则使用当前时间
-        pts = frame.pts
-        if pts is None:
-            pts = time_now_ns()
-        elif not isinstance(pts, int):
-            # 如果pts是浮点数或其他类型，转换为整数纳秒
-            pts = int(pts)
-        
-        ts_frame = cls(
+    def from_audio_raw_frame(cls, frame: AudioRawFrame) -> 'TimestampedAudioFrame':
+        """从AudioRawFrame创建TimestampedAudioFrame，时间戳顺序校验由TimeOrderedBuffer.add_frame负责"""
+        # 缓冲和发送都以单调时钟为基准，上游pts不在同一时钟域，统一使用到达时间作为pts
+        return cls(
             audio=frame.audio,
-            pts=pts,
+            pts=time_now_ns(),
             sample_rate=frame.sample_rate,
             num_channels=frame.num_channels,
             num_frames=frame.num_frames
         )
-        return validate_and_fix_timestamp(ts_frame, last_pts)
 
 
 def validate_and_fix_timestamp(frame: TimestampedAudioFrame, last_pts: Optional[int] = None) -> TimestampedAudioFrame:
-    """验证和修复时间戳"""
-    current_time = time_now_ns()
-    
-    # 检查时间戳是否为None
-    if frame.pts is None:
-        frame.pts = current_time
-        logger.warning("AudioRawFrame has no pts, using current time")
-    
-    # 检查时间戳是否在未来（允许小范围时钟偏差）
-    max_future_offset_ns = 100_000_000  # 100ms
-    if frame.pts > current_time + max_future_offset_ns:
-        logger.warning(f"AudioFrame pts {frame.pts} is significantly in the future, using current time")
-        frame.pts = current_time
-    
-    # 检查时间戳是否在过去太多（可能是旧数据）
-    max_past_offset_ns = 5_000_000_000  # 5秒
-    if frame.pts < current_time - max_past_offset_ns:
-        logger.warning(f"AudioFrame pts {frame.pts} is too old, using current time")
-        frame.pts = current_time
-    
+    """验证和修复时间戳
+
+    pts来自单调时钟，不会出现时钟回拨或跳变，只需保证相对上一帧不倒退
+    """
     # 检查时间戳顺序
     if last_pts is not None and frame.pts < last_pts:
         logger.warning(f"AudioFrame pts {frame.pts} is before last pts {last_pts}, adjusting")
@@ -83,10 +65,45 @@ def validate_and_fix_timestamp(frame: TimestampedAudioFrame, last_pts: Optional[
     return frame
 
 
+def _riff_header(sample_rate: int, channels: int, bits: int, data_size: int) -> bytes:
+    """生成44字节的PCM WAV文件头"""
+    block_align = channels * bits // 8
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', min(data_size + 36, 0xFFFFFFFF), b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, bits,
+        b'data', data_size,
+    )
+
+
+class WavRecorder:
+    """直接写PCM数据的WAV录音文件，文件头只在打开和关闭时各写一次"""
+    def __init__(self, filename: str, sample_rate: int = 16000, channels: int = 1, bits: int = 16):
+        self._file = open(filename, 'wb', buffering=1 << 20)
+        # 数据长度未知，先写入最大值占位，关闭时修正
+        self._file.write(_riff_header(sample_rate, channels, bits, 0xFFFFFFFF))
+        self._total_bytes = 0
+    
+    def writeframes(self, audio: bytes) -> None:
+        self._file.write(audio)
+        self._total_bytes += len(audio)
+    
+    def close(self) -> None:
+        self._file.seek(4)
+        self._file.write(struct.pack('<I', self._total_bytes + 36))
+        self._file.seek(40)
+        self._file.write(struct.pack('<I', self._total_bytes))
+        self._file.close()
+
+
 class TimeOrderedBuffer:
-    """按时间顺序管理的音频缓冲区"""
+    """按时间顺序管理的音频缓冲区
+
+    帧按pts递增到达时只在尾部追加、从头部淘汰，每帧开销为O(1)，与缓冲区时长无关
+    """
     def __init__(self, max_duration_seconds: float = 1.0):
-        self._frames: List[TimestampedAudioFrame] = []
+        self._frames: Deque[TimestampedAudioFrame] = deque()
+        self._pts: Deque[int] = deque()  # 与_frames同步的时间戳列表，供二分查找使用
         self._max_duration_ns = int(max_duration_seconds * 1_000_000_000)
         self._last_pts: Optional[int] = None
     
@@ -94,54 +111,64 @@ class TimeOrderedBuffer:
         """添加帧并处理缓冲区溢出"""
         # 检查单个帧是否过大
         max_frame_duration_ns = 100_000_000  # 100ms
-        frame_duration_ns = frame.num_frames * 1_000_000_000 // frame.sample_rate
-        if frame_duration_ns > max_frame_duration_ns:
-            logger.warning(f"Large audio frame detected: {frame_duration_ns/1_000_000}ms")
+        if frame.duration_ns > max_frame_duration_ns:
+            logger.warning(f"Large audio frame detected: {frame.duration_ns/1_000_000}ms")
         
         # 验证时间戳
         frame = validate_and_fix_timestamp(frame, self._last_pts)
         self._last_pts = frame.pts
         
-        # 使用二分查找插入位置
-        insert_pos = bisect.bisect_left([f.pts for f in self._frames], frame.pts)
-        self._frames.insert(insert_pos, frame)
+        if not self._pts or frame.pts >= self._pts[-1]:
+            # 正常流式音频按时间顺序到达，直接追加到尾部
+            self._frames.append(frame)
+            self._pts.append(frame.pts)
+        else:
+            # 乱序帧才使用二分查找插入位置
+            insert_pos = bisect.bisect_left(self._pts, frame.pts)
+            self._frames.insert(insert_pos, frame)
+            self._pts.insert(insert_pos, frame.pts)
         
         # 检查缓冲区是否溢出
         while self.get_duration_ns() > self._max_duration_ns:
             # 移除最早的帧（正常行为，不记录日志）
-            self._frames.pop(0)
+            self._frames.popleft()
+            self._pts.popleft()
         
-        self._remove_old_frames()
+        self._remove_old_frames(time_now_ns())
     
-    def _remove_old_frames(self) -> None:
-        """移除超过最大持续时间的旧帧"""
+    def _remove_old_frames(self, current_time: int) -> None:
+        """移除在current_time（单调时钟，纳秒）之前超过最大持续时间的旧帧"""
         if not self._frames:
             return
         
-        current_time = time_now_ns()
         cutoff_time = current_time - self._max_duration_ns
         
-        # 找到第一个应该保留的帧
-        first_keep_idx = 0
-        while first_keep_idx < len(self._frames) and self._frames[first_keep_idx].pts < cutoff_time:
-            first_keep_idx += 1
-        
-        if first_keep_idx > 0:
-            self._frames = self._frames[first_keep_idx:]
+        # 从头部移除早于截止时间的帧
+        while self._pts and self._pts[0] < cutoff_time:
+            self._frames.popleft()
+            self._pts.popleft()
     
     def get_frames_up_to(self, pts: int) -> List[TimestampedAudioFrame]:
         """获取指定时间戳之前的所有帧"""
-        cutoff_idx = bisect.bisect_right([f.pts for f in self._frames], pts)
-        result = self._frames[:cutoff_idx]
-        self._frames = self._frames[cutoff_idx:]
+        result = []
+        while self._pts and self._pts[0] <= pts:
+            result.append(self._frames.popleft())
+            self._pts.popleft()
         return result
     
     def get_all_frames(self) -> List[TimestampedAudioFrame]:
         """获取所有帧并清空缓冲区"""
-        result = self._frames.copy()
+        result = list(self._frames)
         self._frames.clear()
+        self._pts.clear()
         return result
     
+    def clear(self) -> None:
+        """清空缓冲区并重置时间戳状态，以便在下一次识别会话中复用"""
+        self._frames.clear()
+        self._pts.clear()
+        self._last_pts = None
+    
     def is_empty(self) -> bool:
         return len(self._frames) == 0
     
@@ -154,40 +181,33 @@ class TimeOrderedBuffer:
         first_frame = self._frames[0]
         last_frame = self._frames[-1]
         
-        # 计算最后一帧的持续时间（纳秒）
-        last_frame_duration_ns = last_frame.num_frames * 1_000_000_000 // last_frame.sample_rate
-        
         # 总持续时间 = (最后一帧时间戳 - 第一帧时间戳) + 最后一帧持续时间
-        total_duration = (last_frame.pts - first_frame.pts) + last_frame_duration_ns
+        total_duration = (last_frame.pts - first_frame.pts) + last_frame.duration_ns
         
         return total_duration
 
 
 class TimeSynchronizedSender:
-    """时间同步发送器，确保按正确时间间隔发送音频"""
-    def __init__(self, recognition_service, sample_rate: int = 16000):
+    """音频发送器：缓冲音频按时间顺序连续发送，实时音频合并成块后发送"""
+    def __init__(self, recognition_service, sample_rate: int = 16000, chunk_duration_seconds: float = 0.2):
         self._recognition = recognition_service
         self._sample_rate = sample_rate
-        self._last_sent_pts: Optional[int] = None
         self._send_task: Optional[asyncio.Task] = None
+        # 实时音频先合并到约200ms再发送，减少WebSocket发送次数（16bit单声道）
+        self._pending_audio = bytearray()
+        self._chunk_bytes = int(chunk_duration_seconds * sample_rate * 2)
     
     async def send_frames_synchronized(self, frames: List[TimestampedAudioFrame]) -> None:
-        """带异常处理的同步发送"""
+        """带异常处理的批量发送
+
+        frames需已按pts升序排列（TimeOrderedBuffer的输出本身有序）。
+        缓冲帧的pts是到达时间，发送时都已过去，因此不按pts节拍等待，直接依次连续发出
+        """
         if not frames:
             return
         
-        frames.sort(key=lambda f: f.pts)
-        current_time = time_now_ns()
-        
         for i, frame in enumerate(frames):
             try:
-                # 计算延迟
-                target_time = frame.pts
-                if target_time > current_time:
-                    delay_seconds = (target_time - current_time) / 1_000_000_000
-                    await asyncio.sleep(delay_seconds)
-                    current_time = time_now_ns()
-                
                 # 发送帧，带重试机制
                 max_retries = 3
                 for retry in range(max_retries):
@@ -198,37 +218,84 @@ class TimeSynchronizedSender:
                         if retry == max_retries - 1:
                             logger.error(f"Failed to send audio frame after {max_retries} retries: {e}")
                             raise
-                        await asyncio.sleep(0.1 * (retry + 1))  # 指数退避
-                
-                self._last_sent_pts = frame.pts
+                        await asyncio.sleep(0)  # 仅让出事件循环，不引入额外延迟
                 
             except Exception as e:
                 logger.error(f"Error sending frame {i}/{len(frames)}: {e}")
                 # 继续处理下一帧，而不是完全失败
                 continue
     
-    async def send_frame_realtime(self, frame: TimestampedAudioFrame) -> None:
-        """实时发送单个帧"""
+    async def send_frame_realtime_raw(self, audio: bytes) -> None:
+        """实时发送原始音频数据，不需要TimestampedAudioFrame包装"""
+        self._pending_audio += audio
+        if len(self._pending_audio) >= self._chunk_bytes:
+            await self.flush()
+    
+    async def flush(self) -> None:
+        """立即发送所有尚未发出的实时音频"""
+        if not self._pending_audio:
+            return
+        audio = bytes(self._pending_audio)
+        self._pending_audio.clear()
+        
         max_retries = 2  # 实时发送减少重试次数
         for retry in range(max_retries):
             try:
-                self._recognition.send_audio_frame(frame.audio)
-                self._last_sent_pts = frame.pts
+                self._recognition.send_audio_frame(audio)
                 break  # 成功发送，退出重试循环
             except Exception as e:
                 if retry == max_retries - 1:
                     # 最后一次重试失败，记录错误但不抛出异常
                     logger.error(f"Failed to send realtime frame after {max_retries} retries: {e}")
                     return
-                # 短暂延迟后重试
-                await asyncio.sleep(0.05 * (retry + 1))
+                # 让出事件循环后立即重试，实时链路不做退避等待
+                await asyncio.sleep(0)
 
 
 class QwenASRCallback(RecognitionCallback):
+    # 中间识别结果的最小推送间隔（纳秒），间隔内只保留最新一条
+    INTERIM_PUSH_INTERVAL_NS = 100_000_000
+
     def __init__(self, service: 'QwenASRService'):
         super().__init__()
         self.service = service
         self.loop = asyncio.get_running_loop()
+        self._tasks = set()
+        # 识别回调线程和事件循环都会读写以下节流状态，统一由锁保护；
+        # 推送也在锁内排入事件循环，保证中间结果不会排在随后的完整句子之后
+        self._interim_lock = threading.Lock()
+        self._last_interim_push_ns = 0
+        self._pending_interim: Optional[str] = None
+        self._interim_flush_scheduled = False
+    
+    def _schedule(self, coro):
+        """从识别回调线程把协程交给事件循环执行"""
+        self.loop.call_soon_threadsafe(self._create_task, coro)
+    
+    def _create_task(self, coro):
+        # 保留任务引用，防止任务在完成前被回收
+        task = self.loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    def _push_interim(self, text: str):
+        self._schedule(self.service.push_frame(InterimTranscriptionFrame(
+            text=text,
+            user_id='',
+            timestamp=time_now_iso8601(),
+        )))
+    
+    def _flush_interim(self):
+        """在事件循环中推送节流期间保留的最新中间结果
+
+        完整句子排入后会清空保留的结果，此时不再推送已过期的中间结果
+        """
+        with self._interim_lock:
+            self._interim_flush_scheduled = False
+            text, self._pending_interim = self._pending_interim, None
+            if text is not None:
+                self._last_interim_push_ns = time_now_ns()
+                self._push_interim(text)
     
     def on_open(self):
         logger.info('Recognition connected')
@@ -238,11 +305,7 @@ class QwenASRCallback(RecognitionCallback):
         if len(self.service._record_base) > 0:
             filename = f'{self.service._record_base}_{self.service._record_index}.wav'
             logger.info(f'Opening recording file {filename}')
-            wav = wave.open(open(filename, 'wb'), 'wb')
-            wav.setsampwidth(2)
-            wav.setnchannels(1)
-            wav.setframerate(16000)
-            self.service._record_wav = wav
+            self.service._start_recording(WavRecorder(filename, sample_rate=16000))
             self.service._record_index += 1
             
         # 处理缓冲区中的历史数据
@@ -259,13 +322,12 @@ class QwenASRCallback(RecognitionCallback):
                                  if t.exception() else None)
             
             # 录制缓冲区音频
-            if self.service._record_wav is not None:
-                for frame in buffered_frames:
-                    self.service._record_wav.writeframes(frame.audio)
+            for frame in buffered_frames:
+                self.service._record(frame.audio)
 
     def on_close(self):
         logger.info('Recognition stopped')
-        asyncio.run_coroutine_threadsafe(self.service._cleanup(), self.loop)
+        self._schedule(self.service._cleanup())
 
     def on_complete(self):
         logger.info('ASR completed')
@@ -277,21 +339,33 @@ class QwenASRCallback(RecognitionCallback):
         sentence = result.get_sentence()
         if 'text' in sentence:
             r = sentence['text']
-            logger.info(f'ASR result: {r}')
+            logger.trace('ASR result: {}', r)
             if RecognitionResult.is_sentence_end(sentence):
                 logger.info(f'Recognition sentence end, request_id: {result.get_request_id()} usage: {result.get_usage(sentence)}')
-                asyncio.run_coroutine_threadsafe(self.service.push_frame(TranscriptionFrame(
-                    text=r,
-                    user_id='',
-                    timestamp=time_now_iso8601(),
-                )), self.loop)
+                # 完整句子覆盖尚未推送的中间结果
+                with self._interim_lock:
+                    self._pending_interim = None
+                    self._schedule(self.service.push_frame(TranscriptionFrame(
+                        text=r,
+                        user_id='',
+                        timestamp=time_now_iso8601(),
+                    )))
             else:
-                logger.info(f'Partial ASR result: {r}')
-                asyncio.run_coroutine_threadsafe(self.service.push_frame(InterimTranscriptionFrame(
-                    text=r,
-                    user_id='',
-                    timestamp=time_now_iso8601(),
-                )), self.loop)
+                logger.trace('Partial ASR result: {}', r)
+                with self._interim_lock:
+                    now = time_now_ns()
+                    elapsed = now - self._last_interim_push_ns
+                    if elapsed >= self.INTERIM_PUSH_INTERVAL_NS:
+                        self._last_interim_push_ns = now
+                        self._pending_interim = None
+                        self._push_interim(r)
+                    else:
+                        # 节流：记住最新结果，到期后由事件循环推送
+                        self._pending_interim = r
+                        if not self._interim_flush_scheduled:
+                            self._interim_flush_scheduled = True
+                            delay = (self.INTERIM_PUSH_INTERVAL_NS - elapsed) / 1_000_000_000
+                            self.loop.call_soon_threadsafe(self.loop.call_later, delay, self._flush_interim)
         else:
             logger.info(f'Unknown asr result: {sentence}')
 
@@ -318,14 +392,15 @@ class QwenASRService(AIService):
             format='wav'
         )
         self._record_index = 0
-        self._record_wav = None
         self._record_base = record_base
+        # 录音写盘在后台任务中完成，避免阻塞事件循环
+        self._record_queue: Optional[asyncio.Queue] = None
+        self._record_task: Optional[asyncio.Task] = None
         
         # 新增时间处理相关属性
         self._time_buffer = TimeOrderedBuffer(max_duration_seconds=1.0)
         self._time_sender = TimeSynchronizedSender(self._recognition, sample_rate=16000)
         self._connection_established_time: Optional[int] = None
-        self._last_pts: Optional[int] = None
 
     async def process_frame(self, frame, direction):
         await super().process_frame(frame, direction)
@@ -345,25 +420,23 @@ class QwenASRService(AIService):
         if self._stopping:
             return
         
+        if self._user_speaking and self._connected:
+            # 连接已建立，实时发送；这条路径不需要时间戳，直接发送原始音频
+            logger.trace('Sending {} bytes of audio with pts {}', len(frame.audio), frame.pts)
+            self._record(frame.audio)
+            await self._time_sender.send_frame_realtime_raw(frame.audio)
+            return
+        
         # 转换为带时间戳的帧
-        ts_frame = TimestampedAudioFrame.from_audio_raw_frame(frame, self._last_pts)
-        self._last_pts = ts_frame.pts
+        ts_frame = TimestampedAudioFrame.from_audio_raw_frame(frame)
         
         if not self._user_speaking:
             # 用户未说话时，添加到缓冲区
             self._time_buffer.add_frame(ts_frame)
-            return
-        
-        if not self._connected:
+        else:
             # 连接未建立，添加到缓冲区
-            logger.info(f'Connecting, cached {len(frame.audio)} bytes of audio with pts {ts_frame.pts}')
+            logger.trace('Connecting, cached {} bytes of audio with pts {}', len(frame.audio), ts_frame.pts)
             self._time_buffer.add_frame(ts_frame)
-        else:
-            # 连接已建立，实时发送
-            logger.info(f'Sending {len(frame.audio)} bytes of audio with pts {ts_frame.pts}')
-            if self._record_wav is not None:
-                self._record_wav.writeframes(frame.audio)
-            await self._time_sender.send_frame_realtime(ts_frame)
     
     async def _user_started_speaking(self, frame: UserStartedSpeakingFrame):
         if frame.emulated:
@@ -380,6 +453,9 @@ class QwenASRService(AIService):
         # Set stopping flag to prevent new frames from being processed
         self._stopping = True
         
+        # Flush realtime audio still waiting to be coalesced into a chunk
+        await self._time_sender.flush()
+        
         # Drain the buffer - send all remaining buffered audio
         if not self._time_buffer.is_empty():
             buffered_frames = self._time_buffer.get_all_frames()
@@ -389,23 +465,57 @@ class QwenASRService(AIService):
             await self._time_sender.send_frames_synchronized(buffered_frames)
             
             # Record buffered audio if recording
-            if self._record_wav is not None:
-                for frame in buffered_frames:
-                    self._record_wav.writeframes(frame.audio)
+            for frame in buffered_frames:
+                self._record(frame.audio)
         
         # Now stop the recognition after buffer is drained
         if self._recognition._running:
             self._recognition.stop()
         
         # Close recording file if open
-        if self._record_wav is not None:
-            self._record_wav.close()
-            self._record_wav = None
+        await self._stop_recording()
+    
+    def _start_recording(self, wav: WavRecorder):
+        """启动后台录音写入任务"""
+        self._record_queue = asyncio.Queue()
+        self._record_task = asyncio.create_task(self._record_writer(wav, self._record_queue))
+    
+    def _record(self, audio: bytes):
+        """把音频交给后台写入任务，不在调用方执行磁盘IO"""
+        if self._record_queue is not None:
+            self._record_queue.put_nowait(audio)
+    
+    async def _stop_recording(self):
+        """通知写入任务结束，并等待文件写完关闭"""
+        if self._record_queue is None:
+            return
+        self._record_queue.put_nowait(None)
+        self._record_queue = None
+        task, self._record_task = self._record_task, None
+        await task
+    
+    async def _record_writer(self, wav: WavRecorder, queue: asyncio.Queue):
+        """在线程中写入录音数据，None表示录音结束"""
+        try:
+            finished = False
+            while not finished:
+                chunks = [await queue.get()]
+                # 一次取出所有已排队的数据，合并为一次写入
+                while not queue.empty():
+                    chunks.append(queue.get_nowait())
+                if chunks[-1] is None:
+                    chunks.pop()
+                    finished = True
+                if chunks:
+                    await asyncio.to_thread(wav.writeframes, b''.join(chunks))
+        except Exception as e:
+            logger.error(f'Failed to write recording: {e}')
+        finally:
+            await asyncio.to_thread(wav.close)
     
     async def _cleanup(self):
         """清理资源"""
         self._connected = False
         self._connection_established_time = None
-        self._last_pts = None
-        self._time_buffer = TimeOrderedBuffer(max_duration_seconds=1.0)
+        self._time_buffer.clear()
         self._stopping = False
\ No newline at end of file
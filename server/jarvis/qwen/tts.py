@@ -2,73 +2,50 @@ from loguru import logger
 from pipecat.services.ai_service import AIService
 from pipecat.frames.frames import TextFrame, LLMFullResponseStartFrame, LLMFullResponseEndFrame, TTSAudioRawFrame, TTSStartedFrame, TTSStoppedFrame, InterimTranscriptionFrame, TranscriptionFrame
 
-import dashscope
-from dashscope.audio.qwen_tts_realtime import *
-import base64
-import asyncio
+import binascii
+import orjson
+import pybase64
+import uuid
+from dashscope.common import utils as dashscope_utils
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import ConnectionClosed
 
-class QwenTTSCallback(QwenTtsRealtimeCallback):
-    def __init__(self, service: 'QwenTTSService'):
-        self.service = service
-        self.loop = asyncio.get_running_loop()
-
-    def on_open(self):
-        logger.info('TTS session opened')
-    
-    def on_close(self, close_status_code, close_msg):
-        logger.info(f'TTS session closed with code {close_status_code} msg {close_msg}')
-    
-    def on_event(self, message):
-        event_type = message['type']
-        logger.info(f'TTS event: {event_type}')
-        match event_type:
-            case 'session.created':
-                pass
-            case 'response.created':
-                asyncio.run_coroutine_threadsafe(self.service.push_frame(TTSStartedFrame()), self.loop)
-            case 'response.audio.delta':
-                audio_b64 = message['delta']
-                audio_bytes = base64.b64decode(audio_b64)
-                logger.info(f'TTS audio delta {len(audio_bytes)} bytes')
-                asyncio.run_coroutine_threadsafe(self.service.push_frame(TTSAudioRawFrame(
-                    audio=audio_bytes,
-                    sample_rate=24000,
-                    num_channels=1,
-                )), self.loop)
-                pass
-            case 'response.done':
-                asyncio.run_coroutine_threadsafe(self.service.push_frame(TTSStoppedFrame()), self.loop)
-            case 'session.finished':
-                self.service.tts.close()
 
 class QwenTTSService(AIService):
+    """Qwen realtime TTS over an asyncio websocket.
+
+    Speaks the same protocol as dashscope's QwenTtsRealtime, but server events
+    are read on the event loop instead of a websocket thread, so audio frames
+    are pushed without a cross-thread hop. Each LLM response gets its own
+    session: session.update, input_text_buffer.append per TextFrame, then
+    session.finish; the server closes out with session.finished.
+    """
+
     def __init__(
             self,
             api_key,
             model='qwen3-tts-flash-realtime',
             base_url='wss://dashscope.aliyuncs.com/api-ws/v1/realtime',
+            workspace=None,
             **kwargs
         ):
         super().__init__(**kwargs)
         self.base_url = base_url
         self.model = model
         self.api_key = api_key
-    
-    async def start(self, frame):
-        await super().start(frame)
-        dashscope.api_key = self.api_key
-        self.callback = QwenTTSCallback(self)
-        self.tts = QwenTtsRealtime(
-            model=self.model,
-            callback=self.callback,
-            url=self.base_url,
-        )
+        self.workspace = workspace
+        self._ws: ClientConnection | None = None
+        # A finished session keeps streaming audio while the next one starts
+        self._receive_tasks = set()
 
     async def stop(self, frame):
         await super().stop(frame)
-        self.callback = None
-        self.tts = None
-    
+        await self._disconnect()
+
+    async def cancel(self, frame):
+        await super().cancel(frame)
+        await self._disconnect()
+
     async def process_frame(self, frame, direction):
         await super().process_frame(frame, direction)
 
@@ -89,17 +66,107 @@ class QwenTTSService(AIService):
 
     async def _start_tts(self, frame: LLMFullResponseStartFrame):
         logger.info('Starting TTS')
-        self.tts.connect()
-        self.tts.update_session(
-            voice='Cherry',
-            response_format=AudioFormat.PCM_24000HZ_MONO_16BIT,
-            mode='server_commit'
+        self._ws = await connect(
+            f'{self.base_url}?model={self.model}',
+            additional_headers=self._handshake_headers(),
+            open_timeout=5,
+            max_size=None,
         )
+        logger.info('TTS session opened')
+        task = self.create_task(self._receive_events(self._ws))
+        self._receive_tasks.add(task)
+        task.add_done_callback(self._receive_tasks.discard)
+        await self._send_event('session.update', session={
+            'voice': 'Cherry',
+            'mode': 'server_commit',
+            'response_format': 'pcm',
+            'sample_rate': 24000,
+        })
+
+    def _handshake_headers(self):
+        """Same handshake headers QwenTtsRealtime sends"""
+        headers = {
+            'user-agent': dashscope_utils.get_user_agent(),
+            'Authorization': f'Bearer {self.api_key}',
+        }
+        # SDK identification headers only exist in newer dashscope releases
+        get_sdk_headers = getattr(dashscope_utils, 'get_sdk_headers', None)
+        if get_sdk_headers is not None:
+            headers.update(get_sdk_headers(module='audio'))
+        if self.workspace:
+            headers['X-DashScope-WorkSpace'] = self.workspace
+        return headers
 
     async def _stop_tts(self, frame: LLMFullResponseEndFrame):
         logger.info('Stopping TTS')
-        self.tts.finish()
+        await self._send_event('session.finish')
 
     async def _send_text(self, frame: TextFrame):
-        logger.info(f'Sending text {frame.text} to TTS')
-        self.tts.append_text(frame.text)
\ No newline at end of file
+        logger.debug('Sending text {} to TTS', frame.text)
+        await self._send_event('input_text_buffer.append', text=frame.text)
+
+    async def _send_event(self, event_type, **fields):
+        if self._ws is None:
+            logger.warning('TTS event {} dropped, no session is open', event_type)
+            return
+        try:
+            await self._ws.send(orjson.dumps(
+                {'event_id': f'event_{uuid.uuid4().hex}', 'type': event_type, **fields}
+            ).decode())
+        except ConnectionClosed as e:
+            logger.warning(f'TTS event {event_type} dropped, session closed: {e}')
+
+    async def _disconnect(self):
+        self._ws = None
+        for task in list(self._receive_tasks):
+            await self.cancel_task(task)
+
+    async def _receive_events(self, ws: ClientConnection):
+        try:
+            async for message in ws:
+                # A bad event is logged and skipped; the session keeps streaming
+                try:
+                    event = orjson.loads(message)
+                    event_type = event.get('type')
+                    logger.trace('TTS event: {}', event_type)
+                    handler = self._HANDLERS.get(event_type)
+                    if handler is not None:
+                        await handler(self, event)
+                except (orjson.JSONDecodeError, AttributeError, KeyError, ValueError, binascii.Error) as e:
+                    logger.error(f'Failed to handle TTS event {str(message)[:200]!r}: {e!r}')
+                    continue
+                if event_type == 'session.finished':
+                    break
+        except ConnectionClosed as e:
+            logger.warning(f'TTS session closed unexpectedly: {e}')
+        finally:
+            await ws.close()
+            if self._ws is ws:
+                self._ws = None
+            logger.info(f'TTS session closed with code {ws.close_code} msg {ws.close_reason}')
+
+    async def _on_response_created(self, event):
+        await self.push_frame(TTSStartedFrame())
+
+    async def _on_audio_delta(self, event):
+        audio_bytes = pybase64.b64decode(event['delta'])
+        logger.trace('TTS audio delta {} bytes', len(audio_bytes))
+        await self.push_frame(TTSAudioRawFrame(
+            audio=audio_bytes,
+            sample_rate=24000,
+            num_channels=1,
+        ))
+
+    async def _on_response_done(self, event):
+        await self.push_frame(TTSStoppedFrame())
+
+    async def _on_error(self, event):
+        logger.error(f"TTS error: {event.get('error')}")
+
+    # Event types without an entry here (e.g. session.created) are ignored
+    _HANDLERS = {
+        'response.created': _on_response_created,
+        'response.audio.delta': _on_audio_delta,
+        'response.done': _on_response_done,
+        'error': _on_error,
+    }
@@ -3,13 +3,19 @@
 This module provides a JSON-based frame serializer for Pipecat framework,
 enabling serialization and deserialization of frames to/from JSON format for
 transmission over WebSocket connections. Supports ANY frame type dynamically.
+A MessagePack variant sharing the same frame layout is provided for binary
+transports.
 """
 
-import base64
 import importlib
-import json
-from typing import Any, Dict, Optional
-
+import sys
+from array import array
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import msgpack
+import orjson
+import pybase64
 from loguru import logger
 
 from pipecat.frames.frames import (
@@ -20,6 +26,373 @@ from pipecat.frames.frames import (
 )
 from pipecat.serializers.base_serializer import FrameSerializer, FrameSerializerType
 
+# Exact types that serialize to JSON unchanged
+_PRIM_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Module frame classes are resolved from when a frame dict has no "module" key
+_DEFAULT_FRAME_MODULE = "pipecat.frames.frames"
+
+# Modules whose classes are registered at import; anything else has to be
+# registered with `register_frame_class`
+_FRAME_MODULES = (_DEFAULT_FRAME_MODULE, "pipecat.metrics.metrics")
+
+# Float lists at least this long are packed as a float64 buffer instead of a JSON array.
+# Shorter ones stay plain lists, so through JSON their NaN and inf items become null
+_ARRAY_MIN_LEN = 64
+
+# Typecodes an __array_fields__ entry may carry; the encoder only writes "d"
+_ARRAY_TYPECODES = frozenset({"d"})
+
+# Base Frame attributes that are not constructor arguments and are copied explicitly
+_BASE_ATTRS = ("id", "name", "pts", "metadata", "transport_source", "transport_destination")
+
+
+@dataclass(frozen=True)
+class _ClassSpec:
+    """Per-class field layout, resolved once and reused for every frame of that class.
+
+    Attributes:
+        type_name: Class name written to the ``___frame___`` key.
+        module_key: Module written to the ``module`` key, or None for classes
+            from pipecat.frames.frames, which is assumed when the key is absent.
+        base_attrs: Base Frame attributes declared by the class, or None when the
+            class is neither a dataclass nor a Pydantic model and must be probed
+            per instance.
+        init_fields: Fields accepted by the constructor.
+        value_fields: Constructor fields serialized after the base attributes.
+        encode: Generated function ``encode(frame, serialize_value, raw_bytes)``
+            building the frame dict, or None when base_attrs is None.
+        decode: Generated function ``decode(frame_dict, deserialize_value)``
+            constructing the frame, or None when base_attrs is None.
+    """
+
+    type_name: str
+    module_key: Optional[str]
+    base_attrs: Optional[Tuple[str, ...]]
+    init_fields: Tuple[str, ...]
+    value_fields: Tuple[str, ...]
+    encode: Optional[Callable[[Any, Callable[[Any], Any], bool], Dict[str, Any]]]
+    decode: Optional[Callable[[Dict[str, Any], Callable[..., Any]], Any]]
+
+
+_CLASS_SPEC_CACHE: Dict[type, _ClassSpec] = {}
+# Pipecat's own frame classes, filled once at import, plus registered ones
+_FRAME_CLASS_CACHE: Dict[Tuple[str, str], type] = {}
+
+
+def _compile(source: str, name: str, namespace: Dict[str, Any]) -> Callable[..., Any]:
+    """Compile generated source and return the function it defines.
+
+    Args:
+        source: Source code defining a single function.
+        name: Name of the function.
+        namespace: Globals for the generated code.
+
+    Returns:
+        The compiled function.
+    """
+    exec(compile(source, f"<jarvis.serializer {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+def _encode_array(value: Any, raw_bytes: bool) -> Any:
+    """Pack a sequence of floats into a little-endian float64 buffer.
+
+    Args:
+        value: List or tuple whose items are all floats.
+        raw_bytes: Whether to return the buffer as bytes instead of base64.
+
+    Returns:
+        The packed buffer, base64-encoded unless raw_bytes is set.
+    """
+    packed = array("d", value)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    data = packed.tobytes()
+    return data if raw_bytes else pybase64.b64encode_as_string(data)
+
+
+def _decode_array(value: Any, typecode: str, is_tuple: bool) -> Any:
+    """Unpack a buffer produced by `_encode_array`.
+
+    Args:
+        value: The packed buffer, as bytes or a base64 string.
+        typecode: array typecode the buffer was packed with.
+        is_tuple: Whether the original value was a tuple.
+
+    Returns:
+        The unpacked list, or tuple if is_tuple is set.
+
+    Raises:
+        ValueError: If the typecode is not in `_ARRAY_TYPECODES`, or the buffer
+            is not a whole number of items.
+    """
+    if typecode not in _ARRAY_TYPECODES:
+        raise ValueError(f"unsupported array typecode {typecode!r}")
+    unpacked = array(typecode)
+    unpacked.frombytes(pybase64.b64decode(value) if isinstance(value, str) else value)
+    if sys.byteorder == "big":
+        unpacked.byteswap()
+    return tuple(unpacked) if is_tuple else unpacked.tolist()
+
+
+def _build_encoder(
+    cls: type,
+    module_key: Optional[str],
+    base_attrs: Tuple[str, ...],
+    value_fields: Tuple[str, ...],
+) -> Callable[[Any, Callable[[Any], Any], bool], Dict[str, Any]]:
+    """Generate a straight-line function converting a frame of `cls` to a dict.
+
+    The generated body reads every field by name, so encoding needs no field
+    iteration or hasattr checks. Exact primitive values are stored as-is;
+    bytes and tuples are marked in the ``__bytes_fields__`` /
+    ``__tuple_fields__`` sidecar lists. Long float lists are packed with
+    `_encode_array` and recorded in the ``__array_fields__`` sidecar dict,
+    mapping the field to its array typecode.
+
+    Args:
+        cls: The dataclass or Pydantic model class.
+        module_key: Module to write to the ``module`` key, if any.
+        base_attrs: Base Frame attributes declared by the class.
+        value_fields: Constructor fields serialized after the base attributes.
+
+    Returns:
+        A function ``encode(frame, serialize_value, raw_bytes)``.
+    """
+    entries = [f"{'___frame___'!r}: {cls.__name__!r}"]
+    if module_key is not None:
+        entries.append(f"{'module'!r}: {module_key!r}")
+    entries += [f"{attr!r}: frame.{attr}" for attr in base_attrs]
+    lines = [
+        "def encode(frame, serialize_value, raw_bytes):",
+        f"    frame_dict = {{{', '.join(entries)}}}",
+        "    bytes_fields = []",
+        "    tuple_fields = []",
+        "    array_fields = {}",
+    ]
+    for name in value_fields:
+        key = repr(name)
+        lines += [
+            f"    value = frame.{name}",
+            "    t = type(value)",
+            "    if t in _PRIM_TYPES:",
+            f"        frame_dict[{key}] = value",
+            "    elif t is bytes or isinstance(value, bytes):",
+            "        if raw_bytes:",
+            f"            frame_dict[{key}] = value",
+            "        else:",
+            f"            frame_dict[{key}] = b64encode_as_string(value)",
+            f"            bytes_fields.append({key})",
+            "    elif (",
+            "        (t is list or t is tuple)",
+            "        and len(value) >= _ARRAY_MIN_LEN",
+            "        and all(type(item) is float for item in value)",
+            "    ):",
+            f"        frame_dict[{key}] = _encode_array(value, raw_bytes)",
+            f"        array_fields[{key}] = 'd'",
+            "        if t is tuple:",
+            f"            tuple_fields.append({key})",
+            "    elif t is tuple or isinstance(value, tuple):",
+            f"        frame_dict[{key}] = serialize_value(value)",
+            f"        tuple_fields.append({key})",
+            "    else:",
+            f"        frame_dict[{key}] = serialize_value(value)",
+        ]
+    lines += [
+        "    if bytes_fields:",
+        "        frame_dict['__bytes_fields__'] = bytes_fields",
+        "    if tuple_fields:",
+        "        frame_dict['__tuple_fields__'] = tuple_fields",
+        "    if array_fields:",
+        "        frame_dict['__array_fields__'] = array_fields",
+        "    return frame_dict",
+    ]
+    namespace = {
+        "_PRIM_TYPES": _PRIM_TYPES,
+        "_ARRAY_MIN_LEN": _ARRAY_MIN_LEN,
+        "_encode_array": _encode_array,
+        "b64encode_as_string": pybase64.b64encode_as_string,
+    }
+    return _compile("\n".join(lines), "encode", namespace)
+
+
+def _build_decoder(
+    cls: type, base_attrs: Tuple[str, ...], init_fields: Tuple[str, ...]
+) -> Callable[[Dict[str, Any], Callable[..., Any]], Any]:
+    """Generate a straight-line function constructing a frame of `cls` from a dict.
+
+    Base attributes are written straight into the instance ``__dict__`` when
+    that is equivalent to object.__setattr__, i.e. instances have a __dict__
+    and no base attribute is a data descriptor.
+
+    Args:
+        cls: The dataclass or Pydantic model class.
+        base_attrs: Base Frame attributes declared by the class.
+        init_fields: Fields accepted by the constructor.
+
+    Returns:
+        A function ``decode(frame_dict, deserialize_value)``.
+    """
+    lines = [
+        "def decode(frame_dict, deserialize_value):",
+        "    bytes_fields = frame_dict.get('__bytes_fields__', ())",
+        "    tuple_fields = frame_dict.get('__tuple_fields__', ())",
+        "    array_fields = frame_dict.get('__array_fields__', ())",
+        "    kwargs = {}",
+    ]
+    for name in init_fields:
+        key = repr(name)
+        lines += [
+            f"    if {key} in frame_dict:",
+            f"        value = frame_dict[{key}]",
+            f"        if {key} in array_fields:",
+            f"            kwargs[{key}] = _decode_array(",
+            f"                value, array_fields[{key}], {key} in tuple_fields",
+            "            )",
+            f"        elif type(value) in _PRIM_TYPES and {key} not in bytes_fields:",
+            f"            kwargs[{key}] = value",
+            "        else:",
+            f"            kwargs[{key}] = deserialize_value(",
+            f"                value, {key} in bytes_fields, {key} in tuple_fields",
+            "            )",
+        ]
+    lines.append("    frame = cls(**kwargs)")
+
+    update_dict = cls.__dictoffset__ != 0 and not any(
+        hasattr(type(getattr(cls, attr, None)), "__set__") for attr in base_attrs
+    )
+    if update_dict and base_attrs:
+        lines.append("    base = {}")
+        for attr in base_attrs:
+            lines += [
+                f"    if {attr!r} in frame_dict:",
+                f"        base[{attr!r}] = frame_dict[{attr!r}]",
+            ]
+        lines.append("    frame.__dict__.update(base)")
+    else:
+        for attr in base_attrs:
+            lines += [
+                f"    if {attr!r} in frame_dict:",
+                f"        object.__setattr__(frame, {attr!r}, frame_dict[{attr!r}])",
+            ]
+    lines.append("    return frame")
+    namespace = {"_PRIM_TYPES": _PRIM_TYPES, "_decode_array": _decode_array, "cls": cls}
+    return _compile("\n".join(lines), "decode", namespace)
+
+
+def _resolve(module_name: str, type_name: str) -> type:
+    """Resolve a frame class by module and class name.
+
+    Only Pipecat's prewarmed classes and registered ones can be resolved, with
+    a single dict hit; names off the wire never reach importlib and nothing is
+    cached for unknown ones.
+
+    Args:
+        module_name: Module the class is defined in.
+        type_name: Name of the class.
+
+    Returns:
+        The resolved class.
+
+    Raises:
+        LookupError: If no such class is registered.
+    """
+    cls = _FRAME_CLASS_CACHE.get((module_name, type_name))
+    if cls is None:
+        raise LookupError(f"{module_name}.{type_name} is not a registered frame class")
+    return cls
+
+
+def _get_spec(cls: type) -> _ClassSpec:
+    """Get the cached field layout of a class, building it on first use.
+
+    Args:
+        cls: The frame (or nested dataclass/Pydantic model) class.
+
+    Returns:
+        The class's _ClassSpec.
+    """
+    spec = _CLASS_SPEC_CACHE.get(cls)
+    if spec is not None:
+        return spec
+
+    if hasattr(cls, "__dataclass_fields__"):
+        dataclass_fields = fields(cls)
+        all_fields = tuple(field_info.name for field_info in dataclass_fields)
+        # Skip fields that are not init (computed fields)
+        init_fields = tuple(
+            field_info.name for field_info in dataclass_fields if field_info.init
+        )
+    elif hasattr(cls, "model_fields"):
+        all_fields = init_fields = tuple(cls.model_fields)
+    else:
+        all_fields = init_fields = None
+
+    module_key = None if cls.__module__ == _DEFAULT_FRAME_MODULE else cls.__module__
+    if all_fields is None:
+        spec = _ClassSpec(cls.__name__, module_key, None, (), (), None, None)
+    else:
+        base_attrs = tuple(attr for attr in _BASE_ATTRS if attr in all_fields)
+        value_fields = tuple(name for name in init_fields if name not in base_attrs)
+        spec = _ClassSpec(
+            cls.__name__,
+            module_key,
+            base_attrs,
+            init_fields,
+            value_fields,
+            _build_encoder(cls, module_key, base_attrs, value_fields),
+            _build_decoder(cls, base_attrs, init_fields),
+        )
+    _CLASS_SPEC_CACHE[cls] = spec
+    return spec
+
+
+def register_frame_class(cls: type) -> type:
+    """Allow a class from outside Pipecat to be deserialized.
+
+    Frame dicts may only name Pipecat's own classes or registered ones. Use it
+    for custom frames and for the dataclasses or Pydantic models they carry;
+    it returns the class, so it also works as a class decorator.
+
+    Args:
+        cls: A dataclass or Pydantic model class.
+
+    Returns:
+        The class itself.
+
+    Raises:
+        TypeError: If the class is neither a dataclass nor a Pydantic model.
+    """
+    if not (isinstance(cls, type) and (is_dataclass(cls) or hasattr(cls, "model_fields"))):
+        raise TypeError(f"{cls!r} is not a dataclass or Pydantic model")
+    _FRAME_CLASS_CACHE[(cls.__module__, cls.__name__)] = cls
+    _get_spec(cls)
+    return cls
+
+
+def _prewarm_pipecat_frames() -> None:
+    """Register and build specs for every class in `_FRAME_MODULES` up front.
+
+    The first frame of each Pipecat type after startup then needs no
+    reflection or code generation. Classes that pipecat.frames.frames imports
+    from elsewhere (VADParams, MetricsData, ...) are registered too, under both
+    names; other modules only contribute the classes they define.
+    """
+    for module_name in _FRAME_MODULES:
+        module = importlib.import_module(module_name)
+        for name, cls in vars(module).items():
+            if not (isinstance(cls, type) and (is_dataclass(cls) or hasattr(cls, "model_fields"))):
+                continue
+            if module_name == _DEFAULT_FRAME_MODULE:
+                _FRAME_CLASS_CACHE[(_DEFAULT_FRAME_MODULE, name)] = cls
+            elif cls.__module__ != module_name:
+                continue
+            register_frame_class(cls)
+
+
+_prewarm_pipecat_frames()
+
 
 class JSONFrameSerializer(FrameSerializer):
     """JSON-based frame serializer for Pipecat.
@@ -32,8 +405,14 @@ class JSONFrameSerializer(FrameSerializer):
         serializer = JSONFrameSerializer()
         json_data = await serializer.serialize(frame)
         frame = await serializer.deserialize(json_data)
+
+    The work is CPU-only, so each async method has a ``*_sync`` twin that
+    callers already off the event loop (or in a tight loop) can use directly.
     """
 
+    # Whether bytes are kept as-is in the frame dict instead of base64-encoded
+    _raw_bytes = False
+
     @property
     def type(self) -> FrameSerializerType:
         """Get the serialization type.
@@ -46,6 +425,52 @@ class JSONFrameSerializer(FrameSerializer):
     async def serialize(self, frame: Any) -> Optional[str]:
         """Serialize a frame to JSON format.
 
+        Args:
+            frame: The frame to serialize (any Frame type).
+
+        Returns:
+            JSON string representation of frame, or None if serialization fails.
+        """
+        return self.serialize_sync(frame)
+
+    async def deserialize(self, data: str) -> Optional[Any]:
+        """Deserialize JSON data back to a frame object.
+
+        Args:
+            data: JSON string containing serialized frame data.
+
+        Returns:
+            Reconstructed Frame object, or None if deserialization fails.
+        """
+        return self.deserialize_sync(data)
+
+    async def serialize_batch(self, frames: List[Any]) -> Optional[str]:
+        """Serialize several frames into a single JSON array.
+
+        Args:
+            frames: The frames to serialize. None entries are skipped.
+
+        Returns:
+            JSON array string with one element per frame, or None if
+            serialization fails.
+        """
+        return self.serialize_batch_sync(frames)
+
+    async def deserialize_batch(self, data: str) -> List[Any]:
+        """Deserialize a JSON array produced by `serialize_batch`.
+
+        Args:
+            data: JSON array string containing serialized frame data.
+
+        Returns:
+            The reconstructed frames, in order. Frames that fail to deserialize
+            are left out.
+        """
+        return self.deserialize_batch_sync(data)
+
+    def serialize_sync(self, frame: Any) -> Optional[str]:
+        """Serialize a frame without going through the event loop.
+
         Args:
             frame: The frame to serialize (any Frame type).
 
@@ -55,22 +480,15 @@ class JSONFrameSerializer(FrameSerializer):
         if frame is None:
             return None
         try:
-            # Special handling for audio frames
-            if isinstance(frame, OutputAudioRawFrame):
-                frame_data = self._serialize_audio(frame)
-            # Special handling for transport message frames
-            elif isinstance(frame, (OutputTransportMessageFrame, OutputTransportMessageUrgentFrame)):
-                frame_data = self._serialize_message(frame)
-            else:
-                frame_data = self._frame_to_dict(frame)
-            json_str = json.dumps(frame_data)
+            frame_data = self._frame_data(frame)
+            json_str = orjson.dumps(frame_data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
             return json_str
         except Exception as e:
             logger.error(f"Failed to serialize frame {frame.__class__.__name__}: {e}")
             return None
 
-    async def deserialize(self, data: str) -> Optional[Any]:
-        """Deserialize JSON data back to a frame object.
+    def deserialize_sync(self, data: str) -> Optional[Any]:
+        """Deserialize a frame without going through the event loop.
 
         Args:
             data: JSON string containing serialized frame data.
@@ -79,23 +497,108 @@ class JSONFrameSerializer(FrameSerializer):
             Reconstructed Frame object, or None if deserialization fails.
         """
         try:
-            frame_dict = json.loads(data)
-            # Check for special type markers
-            frame_type = frame_dict.get("___type___")
-            if frame_type == "audio":
-                frame = self._deserialize_audio(frame_dict)
-            elif frame_type == "message":
-                frame = self._deserialize_message(frame_dict)
-            else:
-                frame = self._dict_to_frame(frame_dict)
-            return frame
-        except json.JSONDecodeError as e:
+            frame_dict = orjson.loads(data)
+            return self._frame_from_data(frame_dict)
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to decode JSON data: {e}")
             return None
         except Exception as e:
             logger.error(f"Failed to deserialize frame: {e}")
             return None
 
+    def serialize_batch_sync(self, frames: List[Any]) -> Optional[str]:
+        """Serialize several frames without going through the event loop.
+
+        Args:
+            frames: The frames to serialize. None entries are skipped.
+
+        Returns:
+            JSON array string with one element per frame, or None if
+            serialization fails.
+        """
+        try:
+            batch = [self._frame_data(frame) for frame in frames if frame is not None]
+            return orjson.dumps(batch, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except Exception as e:
+            logger.error(f"Failed to serialize batch of {len(frames)} frames: {e}")
+            return None
+
+    def deserialize_batch_sync(self, data: str) -> List[Any]:
+        """Deserialize a batch without going through the event loop.
+
+        Args:
+            data: JSON array string containing serialized frame data.
+
+        Returns:
+            The reconstructed frames, in order. Frames that fail to deserialize
+            are left out.
+        """
+        try:
+            batch = orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to decode JSON data: {e}")
+            return []
+        return self._frames_from_batch(batch)
+
+    def _frames_from_batch(self, batch: Any) -> List[Any]:
+        """Convert a decoded batch back to frames.
+
+        Args:
+            batch: Decoded list of frame dictionaries.
+
+        Returns:
+            The reconstructed frames, in order, without the ones that failed.
+        """
+        if not isinstance(batch, list):
+            logger.error(f"Invalid frame batch: expected a list, got {type(batch).__name__}")
+            return []
+        frames = []
+        for frame_dict in batch:
+            try:
+                frame = self._frame_from_data(frame_dict)
+            except Exception as e:
+                logger.error(f"Failed to deserialize frame: {e}")
+                continue
+            if frame is not None:
+                frames.append(frame)
+        return frames
+
+    def _frame_data(self, frame: Any) -> Dict[str, Any]:
+        """Convert a frame to the dictionary that is sent on the wire.
+
+        Args:
+            frame: The frame to convert (any Frame type).
+
+        Returns:
+            Dictionary containing the frame data.
+        """
+        # Special handling for audio frames
+        if isinstance(frame, OutputAudioRawFrame):
+            return self._serialize_audio(frame)
+        # Special handling for transport message frames
+        elif isinstance(frame, (OutputTransportMessageFrame, OutputTransportMessageUrgentFrame)):
+            return self._serialize_message(frame)
+        else:
+            return self._frame_to_dict(frame)
+
+    def _frame_from_data(self, frame_dict: Dict[str, Any]) -> Optional[Any]:
+        """Convert a dictionary received from the wire back to a frame.
+
+        Args:
+            frame_dict: Dictionary containing the frame data.
+
+        Returns:
+            Reconstructed Frame object, or None if frame type is unknown.
+        """
+        # Check for special type markers
+        frame_type = frame_dict.get("___type___")
+        if frame_type == "audio":
+            return self._deserialize_audio(frame_dict)
+        elif frame_type == "message":
+            return self._deserialize_message(frame_dict)
+        else:
+            return self._dict_to_frame(frame_dict)
+
     def _frame_to_dict(self, frame: Any) -> Dict[str, Any]:
         """Convert a frame object to a dictionary representation.
 
@@ -105,59 +608,19 @@ class JSONFrameSerializer(FrameSerializer):
         Returns:
             Dictionary containing frame data with type and fields.
         """
+        spec = _get_spec(frame.__class__)
+        if spec.encode is not None:
+            return spec.encode(frame, self._serialize_value, self._raw_bytes)
+
+        # Neither a dataclass nor a Pydantic model: only the base Frame fields
         frame_dict = {
-            "___frame___": frame.__class__.__name__,
+            "___frame___": spec.type_name,
         }
-
-        # Handle base Frame fields
-        if hasattr(frame, "id"):
-            frame_dict["id"] = frame.id
-        if hasattr(frame, "name"):
-            frame_dict["name"] = frame.name
-        if hasattr(frame, "pts"):
-            frame_dict["pts"] = frame.pts
-        if hasattr(frame, "metadata"):
-            frame_dict["metadata"] = frame.metadata
-        if hasattr(frame, "transport_source"):
-            frame_dict["transport_source"] = frame.transport_source
-        if hasattr(frame, "transport_destination"):
-            frame_dict["transport_destination"] = frame.transport_destination
-
-        # Get all fields from the frame using dataclass inspection
-        if hasattr(frame, "__dataclass_fields__"):
-            for field_name, field_info in frame.__dataclass_fields__.items():
-                # Skip fields that are not init (computed fields)
-                if not field_info.init:
-                    continue
-
-                if field_name in frame_dict:
-                    continue
-
-                if hasattr(frame, field_name):
-                    value = getattr(frame, field_name)
-                    # Mark bytes fields for proper deserialization
-                    if isinstance(value, bytes):
-                        frame_dict[f"__{field_name}_is_bytes__"] = True
-                    # Track tuple fields for proper restoration
-                    if isinstance(value, tuple):
-                        frame_dict[f"__{field_name}_is_tuple__"] = True
-                    frame_dict[field_name] = self._serialize_value(value)
-        # Handle Pydantic models - use class.model_fields instead of instance
-        elif hasattr(frame.__class__, "model_fields"):
-            for field_name in frame.__class__.model_fields:
-                if field_name in frame_dict:
-                    continue
-
-                if hasattr(frame, field_name):
-                    value = getattr(frame, field_name)
-                    # Mark bytes fields for proper deserialization
-                    if isinstance(value, bytes):
-                        frame_dict[f"__{field_name}_is_bytes__"] = True
-                    # Track tuple fields for proper restoration
-                    if isinstance(value, tuple):
-                        frame_dict[f"__{field_name}_is_tuple__"] = True
-                    frame_dict[field_name] = self._serialize_value(value)
-
+        if spec.module_key is not None:
+            frame_dict["module"] = spec.module_key
+        for attr in _BASE_ATTRS:
+            if hasattr(frame, attr):
+                frame_dict[attr] = getattr(frame, attr)
         return frame_dict
 
     def _serialize_audio(self, frame: OutputAudioRawFrame) -> Dict[str, Any]:
@@ -171,7 +634,7 @@ class JSONFrameSerializer(FrameSerializer):
         """
         return {
             "___type___": "audio",
-            "audio": base64.b64encode(frame.audio).decode("utf-8"),
+            "audio": frame.audio if self._raw_bytes else pybase64.b64encode_as_string(frame.audio),
             "sample_rate": frame.sample_rate,
             "num_channels": frame.num_channels,
         }
@@ -199,7 +662,9 @@ class JSONFrameSerializer(FrameSerializer):
         Returns:
             Reconstructed OutputAudioRawFrame instance.
         """
-        audio_bytes = base64.b64decode(frame_dict["audio"])
+        audio_bytes = frame_dict["audio"]
+        if isinstance(audio_bytes, str):
+            audio_bytes = pybase64.b64decode(audio_bytes)
         return InputAudioRawFrame(
             audio=audio_bytes,
             sample_rate=frame_dict["sample_rate"],
@@ -235,61 +700,25 @@ class JSONFrameSerializer(FrameSerializer):
             logger.error(f"Invalid frame dict: missing type")
             return None
 
-        try:
-            # Dynamically import the frame class from pipecat.frames.frames
-            module = importlib.import_module("pipecat.frames.frames")
-            frame_class = getattr(module, frame_type_name)
-
-            # Extract constructor arguments from the dict
-            # Remove non-constructor fields
-            constructor_args = {}
-            if hasattr(frame_class, "__dataclass_fields__"):
-                for field_name, field_info in frame_class.__dataclass_fields__.items():
-                    if field_name in frame_dict and field_info.init:
-                        value = frame_dict[field_name]
-                        # Check if this field was originally bytes
-                        is_bytes_marker = frame_dict.get(f"__{field_name}_is_bytes__", False)
-                        # Check if this field was originally tuple
-                        is_tuple_marker = frame_dict.get(f"__{field_name}_is_tuple__", False)
-                        constructor_args[field_name] = self._deserialize_value(value, is_bytes_marker, is_tuple_marker)
-            # Handle Pydantic models
-            elif hasattr(frame_class, "model_fields"):
-                for field_name in frame_class.model_fields:
-                    if field_name in frame_dict:
-                        value = frame_dict[field_name]
-                        # Check if this field was originally bytes
-                        is_bytes_marker = frame_dict.get(f"__{field_name}_is_bytes__", False)
-                        # Check if this field was originally tuple
-                        is_tuple_marker = frame_dict.get(f"__{field_name}_is_tuple__", False)
-                        constructor_args[field_name] = self._deserialize_value(value, is_bytes_marker, is_tuple_marker)
-             
-            # Remove marker fields (they're not actual frame fields)
-            constructor_args = {k: v for k, v in constructor_args.items() if not (k.startswith("__") and k.endswith("__"))}
-
-            # Create the frame instance
-            frame = frame_class(**constructor_args)
-
-            # Set non-init fields
-            if "id" in frame_dict and hasattr(frame, "id"):
-                object.__setattr__(frame, "id", frame_dict["id"])
-            if "name" in frame_dict and hasattr(frame, "name"):
-                object.__setattr__(frame, "name", frame_dict["name"])
-            if "pts" in frame_dict and hasattr(frame, "pts"):
-                object.__setattr__(frame, "pts", frame_dict["pts"])
-            if "metadata" in frame_dict and hasattr(frame, "metadata"):
-                object.__setattr__(frame, "metadata", frame_dict["metadata"])
-            if "transport_source" in frame_dict and hasattr(frame, "transport_source"):
-                object.__setattr__(frame, "transport_source", frame_dict["transport_source"])
-            if "transport_destination" in frame_dict and hasattr(frame, "transport_destination"):
-                object.__setattr__(frame, "transport_destination", frame_dict["transport_destination"])
+        frame_module = frame_dict.get("module", _DEFAULT_FRAME_MODULE)
 
+        try:
+            # Look up the frame class, pipecat.frames.frames by default
+            frame_class = _resolve(frame_module, frame_type_name)
+
+            spec = _get_spec(frame_class)
+            if spec.decode is not None:
+                return spec.decode(frame_dict, self._deserialize_value)
+
+            # Neither a dataclass nor a Pydantic model: only the base Frame fields
+            frame = frame_class()
+            for attr in _BASE_ATTRS:
+                if attr in frame_dict and hasattr(frame, attr):
+                    object.__setattr__(frame, attr, frame_dict[attr])
             return frame
 
-        except ImportError as e:
-            logger.error(f"Failed to import module {frame_module}: {e}")
-            return None
-        except AttributeError as e:
-            logger.error(f"Frame class {frame_type_name} not found in module {frame_module}: {e}")
+        except LookupError as e:
+            logger.error(f"Refusing frame {frame_type_name} from module {frame_module}: {e}")
             return None
         except Exception as e:
             logger.error(f"Failed to create frame of type {frame_type_name}: {e}")
@@ -298,37 +727,69 @@ class JSONFrameSerializer(FrameSerializer):
     def _serialize_value(self, value: Any) -> Any:
         """Serialize a value to JSON-compatible format.
 
+        Containers are walked with an explicit stack instead of recursion: each
+        output container is allocated up front and its children are filled in
+        as they are popped.
+
         Args:
             value: The value to serialize.
 
         Returns:
             JSON-serializable representation of the value.
         """
-        if value is None:
-            return None
-        elif isinstance(value, (str, int, float, bool)):
+        if type(value) in _PRIM_TYPES:
             return value
+        result, stack = self._serialize_node(value)
+        while stack:
+            parent, key, child = stack.pop()
+            if type(child) in _PRIM_TYPES:
+                parent[key] = child
+                continue
+            parent[key], children = self._serialize_node(child)
+            stack.extend(children)
+        return result
+
+    def _serialize_node(self, value: Any) -> Tuple[Any, list]:
+        """Convert a single non-primitive value for `_serialize_value`.
+
+        Args:
+            value: The value to convert.
+
+        Returns:
+            Tuple of the converted value and the ``(parent, key, child)`` work
+            items still to be converted into it.
+        """
+        if value is None or isinstance(value, (str, int, float, bool)):
+            return value, []
         elif isinstance(value, bytes):
-            return base64.b64encode(value).decode("utf-8")
+            if self._raw_bytes:
+                return value, []
+            return pybase64.b64encode_as_string(value), []
         elif isinstance(value, (list, tuple)):
-            return [self._serialize_value(item) for item in value]
+            out = [None] * len(value)
+            return out, [(out, i, item) for i, item in enumerate(value)]
         elif isinstance(value, dict):
-            return {k: self._serialize_value(v) for k, v in value.items()}
+            # Pre-populate keys so the output keeps the input's key order
+            out = dict.fromkeys(value)
+            return out, [(out, k, v) for k, v in value.items()]
         elif hasattr(value.__class__, "model_fields"):
             # Handle Pydantic model instances recursively
-            return self._frame_to_dict(value)
+            return self._frame_to_dict(value), []
         elif hasattr(value, "__dataclass_fields__"):
             # Handle dataclass instances recursively
-            return self._frame_to_dict(value)
+            return self._frame_to_dict(value), []
         elif hasattr(value, "__dict__"):
             # Handle regular objects
-            return {k: self._serialize_value(v) for k, v in value.__dict__.items()}
+            out = dict.fromkeys(value.__dict__)
+            return out, [(out, k, v) for k, v in value.__dict__.items()]
         else:
-            return str(value)
+            return str(value), []
 
     def _deserialize_value(self, value: Any, is_bytes: bool = False, is_tuple: bool = False) -> Any:
         """Deserialize a value from JSON format.
 
+        Uses the same explicit-stack walk as `_serialize_value`.
+
         Args:
             value: The value to deserialize.
             is_bytes: Whether the original value was bytes (for base64 decoding).
@@ -337,29 +798,137 @@ class JSONFrameSerializer(FrameSerializer):
         Returns:
             Deserialized value.
         """
-        if value is None:
-            return None
-        elif isinstance(value, str) and is_bytes:
+        if is_bytes and isinstance(value, str):
             # Decode base64 string back to bytes
-            return base64.b64decode(value)
-        elif isinstance(value, (str, int, float, bool)):
+            return pybase64.b64decode(value)
+        if type(value) in _PRIM_TYPES:
             return value
-        elif isinstance(value, list):
-            # Recursively deserialize list items
-            deserialized_list = []
-            for item in value:
-                # Check if item is a serialized frame/dataclass
-                if isinstance(item, dict) and "___frame___" in item:
-                    deserialized_list.append(self._dict_to_frame(item))
-                else:
-                    deserialized_list.append(self._deserialize_value(item))
-            # Convert to tuple if this was originally a tuple
-            return tuple(deserialized_list) if is_tuple else deserialized_list
+        result, stack = self._deserialize_node(value)
+        while stack:
+            parent, key, child = stack.pop()
+            if type(child) in _PRIM_TYPES:
+                parent[key] = child
+                continue
+            parent[key], children = self._deserialize_node(child)
+            stack.extend(children)
+        # Convert to tuple if this was originally a tuple
+        if is_tuple and isinstance(result, list):
+            return tuple(result)
+        return result
+
+    def _deserialize_node(self, value: Any) -> Tuple[Any, list]:
+        """Convert a single non-primitive value for `_deserialize_value`.
+
+        Args:
+            value: The value to convert.
+
+        Returns:
+            Tuple of the converted value and the ``(parent, key, child)`` work
+            items still to be converted into it.
+        """
+        if isinstance(value, list):
+            out = [None] * len(value)
+            return out, [(out, i, item) for i, item in enumerate(value)]
         elif isinstance(value, dict):
             # Check if this is a serialized frame
             if "___frame___" in value:
-                return self._dict_to_frame(value)
-            else:
-                return {k: self._deserialize_value(v) for k, v in value.items()}
+                return self._dict_to_frame(value), []
+            out = dict.fromkeys(value)
+            return out, [(out, k, v) for k, v in value.items()]
         else:
-            return value
+            return value, []
+
+
+class MsgPackFrameSerializer(JSONFrameSerializer):
+    """MessagePack-based frame serializer for Pipecat.
+
+    Uses the same frame layout as JSONFrameSerializer, but packs it with
+    MessagePack for binary transports. Bytes fields are sent as native
+    ``bin`` values, so they need neither base64 nor ``__bytes_fields__``.
+
+    Example:
+        serializer = MsgPackFrameSerializer()
+        data = await serializer.serialize(frame)
+        frame = await serializer.deserialize(data)
+    """
+
+    _raw_bytes = True
+
+    @property
+    def type(self) -> FrameSerializerType:
+        """Get the serialization type.
+
+        Returns:
+            FrameSerializerType.BINARY indicating binary MessagePack serialization.
+        """
+        return FrameSerializerType.BINARY
+
+    def serialize_sync(self, frame: Any) -> Optional[bytes]:
+        """Serialize a frame without going through the event loop.
+
+        Args:
+            frame: The frame to serialize (any Frame type).
+
+        Returns:
+            MessagePack representation of frame, or None if serialization fails.
+        """
+        if frame is None:
+            return None
+        try:
+            return msgpack.packb(self._frame_data(frame), use_bin_type=True)
+        except Exception as e:
+            logger.error(f"Failed to serialize frame {frame.__class__.__name__}: {e}")
+            return None
+
+    def deserialize_sync(self, data: bytes) -> Optional[Any]:
+        """Deserialize a frame without going through the event loop.
+
+        Args:
+            data: MessagePack data containing serialized frame data.
+
+        Returns:
+            Reconstructed Frame object, or None if deserialization fails.
+        """
+        try:
+            frame_dict = msgpack.unpackb(data, raw=False, strict_map_key=False)
+            return self._frame_from_data(frame_dict)
+        except (msgpack.UnpackException, ValueError) as e:
+            logger.error(f"Failed to decode MessagePack data: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to deserialize frame: {e}")
+            return None
+
+    def serialize_batch_sync(self, frames: List[Any]) -> Optional[bytes]:
+        """Serialize several frames without going through the event loop.
+
+        Args:
+            frames: The frames to serialize. None entries are skipped.
+
+        Returns:
+            MessagePack array with one element per frame, or None if
+            serialization fails.
+        """
+        try:
+            batch = [self._frame_data(frame) for frame in frames if frame is not None]
+            return msgpack.packb(batch, use_bin_type=True)
+        except Exception as e:
+            logger.error(f"Failed to serialize batch of {len(frames)} frames: {e}")
+            return None
+
+    def deserialize_batch_sync(self, data: bytes) -> List[Any]:
+        """Deserialize a batch without going through the event loop.
+
+        Args:
+            data: MessagePack array containing serialized frame data.
+
+        Returns:
+            The reconstructed frames, in order. Frames that fail to deserialize
+            are left out.
+        """
+        try:
+            batch = msgpack.unpackb(data, raw=False, strict_map_key=False)
+        except (msgpack.UnpackException, ValueError) as e:
+            logger.error(f"Failed to decode MessagePack data: {e}")
+            return []
+        return self._frames_from_batch(batch)
@@ -1,6 +1,11 @@
 """Unit tests for JSON Frame Serializer."""
 
 import asyncio
+import hashlib
+import logging
+import math
+import struct
+
 import pytest
 
 from pipecat.frames.frames import (
@@ -36,302 +41,256 @@ from pipecat.frames.frames import (
     UserStoppedSpeakingFrame,
 )
 
-from .serializer import JSONFrameSerializer
+from .serializer import JSONFrameSerializer, MsgPackFrameSerializer, register_frame_class
+
+# Diagnostics are only emitted with --log-level=DEBUG
+logger = logging.getLogger(__name__)
+
+# Sample payloads shared by the tests; frames never mutate them
+_AUDIO_800 = b"\x00\x01\x02\x03\x04\x05\x06\x07" * 100
+_IMAGE_4000 = b"\x00\x01\x02\x03\x04\x05\x06\x07" * 500
+_COMPLEX_MESSAGE = {
+    "action": "update",
+    "data": {
+        "nested": {
+            "list": [1, 2, 3],
+            "dict": {"key": "value"},
+            "string": "test",
+        }
+    },
+    "metadata": {
+        "timestamp": 1234567890,
+        "tags": ["tag1", "tag2"],
+    },
+}
+
+
+def _digest(data):
+    """Return a short digest so large payload mismatches stay readable in reports."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
 
+_AUDIO_800_DIGEST = _digest(_AUDIO_800)
+_IMAGE_4000_DIGEST = _digest(_IMAGE_4000)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def serializer():
-    """Create a serializer instance for testing."""
+    """Create a serializer instance shared by all tests; it holds no per-test state."""
     return JSONFrameSerializer()
 
 
-@pytest.mark.asyncio
-async def test_serializer_type(serializer):
+@pytest.fixture(scope="session")
+def msgpack_serializer():
+    """Create a MessagePack serializer instance shared by all tests."""
+    return MsgPackFrameSerializer()
+
+
+def _rt(serializer, frame):
+    """Serialize a frame and deserialize it back."""
+    data = serializer.serialize_sync(frame)
+    assert data is not None
+    return serializer.deserialize_sync(data)
+
+
+def _rt_many(serializer, frames):
+    """Roundtrip several frames through one batch payload."""
+    data = serializer.serialize_batch_sync(frames)
+    assert data is not None
+    deserialized = serializer.deserialize_batch_sync(data)
+    assert len(deserialized) == len(frames)
+    return deserialized
+
+
+def test_serializer_type(serializer):
     """Test that serializer returns correct type."""
     from pipecat.serializers.base_serializer import FrameSerializerType
 
-    print(f"\n=== Test: test_serializer_type ===")
-    print(f"Serializer type: {serializer.type}")
-    print(f"Expected type: {FrameSerializerType.TEXT}")
-    print("=" * 50)
+    logger.debug("\n=== Test: test_serializer_type ===")
+    logger.debug("Serializer type: %s", serializer.type)
+    logger.debug("Expected type: %s", FrameSerializerType.TEXT)
+    logger.debug("=" * 50)
     
     assert serializer.type == FrameSerializerType.TEXT
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_text_frame(serializer):
+def test_serialize_deserialize_text_frame(serializer):
     """Test serialization and deserialization of TextFrame."""
     original = TextFrame(text="Hello, world!")
-    json_data = await serializer.serialize(original)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
     
     # Output serialized data for demonstration
-    print(f"\n=== Serialized {original.__class__.__name__} ===")
-    print(json_data)
-    print("=" * 50)
+    logger.debug("\n=== Serialized %s ===", original.__class__.__name__)
+    logger.debug("%s", json_data)
+    logger.debug("=" * 50)
 
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
     
     # Output deserialized frame info for demonstration
-    print(f"\n=== Deserialized {deserialized.__class__.__name__} ===")
-    print(f"Type: {deserialized.__class__.__name__}")
-    print(f"Module: {deserialized.__class__.__module__}")
-    print("=" * 50)
+    logger.debug("\n=== Deserialized %s ===", deserialized.__class__.__name__)
+    logger.debug("Type: %s", deserialized.__class__.__name__)
+    logger.debug("Module: %s", deserialized.__class__.__module__)
+    logger.debug("=" * 50)
     
     assert isinstance(deserialized, TextFrame)
     assert deserialized.text == original.text
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_output_audio_frame(serializer):
-    """Test serialization and deserialization of OutputAudioRawFrame."""
-    print(f"\n=== Test: test_serialize_deserialize_output_audio_frame ===")
-    
-    audio_data = b"\x00\x01\x02\x03\x04\x05\x06\x07" * 100  # Sample audio
-    original = OutputAudioRawFrame(
-        audio=audio_data,
-        sample_rate=24000,
-        num_channels=1,
-    )
-    json_data = await serializer.serialize(original)
-    assert json_data is not None
-    
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Audio data length: {len(original.audio)} bytes")
-    print(f"Sample rate: {original.sample_rate}")
-    print(f"Channels: {original.num_channels}")
-    print(f"Num frames: {original.num_frames}")
-    print(f"Serialized data length: {len(json_data)} chars")
-
-    deserialized = await serializer.deserialize(json_data)
-    assert deserialized is not None
-    assert isinstance(deserialized, OutputAudioRawFrame)
-    assert deserialized.audio == original.audio
-    assert deserialized.sample_rate == original.sample_rate
-    assert deserialized.num_channels == original.num_channels
-    assert deserialized.num_frames == original.num_frames
-    
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Audio data preserved: {deserialized.audio == original.audio}")
-    print(f"Sample rate preserved: {deserialized.sample_rate == original.sample_rate}")
-    print(f"Channels preserved: {deserialized.num_channels == original.num_channels}")
-    print(f"Num frames preserved: {deserialized.num_frames == original.num_frames}")
-    print("=" * 50)
-
+@pytest.mark.parametrize(
+    "frame_class,kwargs,payload,attrs",
+    [
+        pytest.param(
+            OutputAudioRawFrame,
+            dict(audio=_AUDIO_800, sample_rate=24000, num_channels=1),
+            ("audio", _AUDIO_800_DIGEST),
+            ("sample_rate", "num_channels", "num_frames"),
+            id="output_audio",
+        ),
+        pytest.param(
+            InputAudioRawFrame,
+            dict(audio=_AUDIO_800, sample_rate=16000, num_channels=1),
+            ("audio", _AUDIO_800_DIGEST),
+            ("sample_rate", "num_channels"),
+            id="input_audio",
+        ),
+        pytest.param(
+            OutputImageRawFrame,
+            dict(image=_IMAGE_4000, size=(640, 480), format="RGB"),
+            ("image", _IMAGE_4000_DIGEST),
+            ("size", "format"),
+            id="output_image",
+        ),
+        pytest.param(
+            InputImageRawFrame,
+            dict(image=_IMAGE_4000, size=(320, 240), format="RGBA"),
+            ("image", _IMAGE_4000_DIGEST),
+            ("size", "format"),
+            id="input_image",
+        ),
+    ],
+)
+def test_serialize_deserialize_raw_frame(serializer, frame_class, kwargs, payload, attrs):
+    """Test serialization and deserialization of raw audio and image frames."""
+    logger.debug("\n=== Test: test_serialize_deserialize_raw_frame[%s] ===", frame_class.__name__)
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_input_audio_frame(serializer):
-    """Test serialization and deserialization of InputAudioRawFrame."""
-    print(f"\n=== Test: test_serialize_deserialize_input_audio_frame ===")
-    
-    audio_data = b"\x00\x01\x02\x03\x04\x05\x06\x07" * 100
-    original = InputAudioRawFrame(
-        audio=audio_data,
-        sample_rate=16000,
-        num_channels=1,
-    )
-    json_data = await serializer.serialize(original)
+    original = frame_class(**kwargs)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
-    
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Audio data length: {len(original.audio)} bytes")
-    print(f"Sample rate: {original.sample_rate}")
-    print(f"Channels: {original.num_channels}")
-    print(f"Serialized data length: {len(json_data)} chars")
-
-    deserialized = await serializer.deserialize(json_data)
-    assert deserialized is not None
-    assert isinstance(deserialized, InputAudioRawFrame)
-    assert deserialized.audio == original.audio
-    assert deserialized.sample_rate == original.sample_rate
-    assert deserialized.num_channels == original.num_channels
-    
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Audio data preserved: {deserialized.audio == original.audio}")
-    print(f"Sample rate preserved: {deserialized.sample_rate == original.sample_rate}")
-    print(f"Channels preserved: {deserialized.num_channels == original.num_channels}")
-    print("=" * 50)
 
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Serialized data length: %d chars", len(json_data))
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_output_image_frame(serializer):
-    """Test serialization and deserialization of OutputImageRawFrame."""
-    print(f"\n=== Test: test_serialize_deserialize_output_image_frame ===")
-    
-    image_data = b"\x00\x01\x02\x03\x04\x05\x06\x07" * 500  # Sample image
-    original = OutputImageRawFrame(
-        image=image_data,
-        size=(640, 480),
-        format="RGB",
-    )
-    json_data = await serializer.serialize(original)
-    assert json_data is not None
-    
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Image data length: {len(original.image)} bytes")
-    print(f"Size: {original.size}")
-    print(f"Format: {original.format}")
-    print(f"Serialized data length: {len(json_data)} chars")
-
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
-    assert isinstance(deserialized, OutputImageRawFrame)
-    assert deserialized.image == original.image
-    assert deserialized.size == original.size
-    assert deserialized.format == original.format
-    
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Image data preserved: {deserialized.image == original.image}")
-    print(f"Size preserved: {deserialized.size == original.size}")
-    print(f"Format preserved: {deserialized.format == original.format}")
-    print("=" * 50)
+    assert isinstance(deserialized, frame_class)
+    payload_attr, payload_digest = payload
+    assert _digest(getattr(deserialized, payload_attr)) == payload_digest
+    for attr in attrs:
+        assert getattr(deserialized, attr) == getattr(original, attr), attr
+        logger.debug("%s preserved", attr)
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_input_image_frame(serializer):
-    """Test serialization and deserialization of InputImageRawFrame."""
-    print(f"\n=== Test: test_serialize_deserialize_input_image_frame ===")
-    
-    image_data = b"\x00\x01\x02\x03\x04\x05\x06\x07" * 500
-    original = InputImageRawFrame(
-        image=image_data,
-        size=(320, 240),
-        format="RGBA",
-    )
-    json_data = await serializer.serialize(original)
-    assert json_data is not None
-    
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Image data length: {len(original.image)} bytes")
-    print(f"Size: {original.size}")
-    print(f"Format: {original.format}")
-    print(f"Serialized data length: {len(json_data)} chars")
-
-    deserialized = await serializer.deserialize(json_data)
-    assert deserialized is not None
-    assert isinstance(deserialized, InputImageRawFrame)
-    assert deserialized.image == original.image
-    assert deserialized.size == original.size
-    assert deserialized.format == original.format
-    
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Image data preserved: {deserialized.image == original.image}")
-    print(f"Size preserved: {deserialized.size == original.size}")
-    print(f"Format preserved: {deserialized.format == original.format}")
-    print("=" * 50)
-
-
-@pytest.mark.asyncio
-async def test_serialize_deserialize_transcription_frame(serializer):
+def test_serialize_deserialize_transcription_frame(serializer):
     """Test serialization and deserialization of TranscriptionFrame."""
-    print(f"\n=== Test: test_serialize_deserialize_transcription_frame ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_transcription_frame ===")
     
     original = TranscriptionFrame(
         text="This is a transcription",
         user_id="user123",
         timestamp="2024-01-01T00:00:00Z",
     )
-    json_data = await serializer.serialize(original)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
     
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Text: {original.text}")
-    print(f"User ID: {original.user_id}")
-    print(f"Timestamp: {original.timestamp}")
-    print(f"Serialized data length: {len(json_data)} chars")
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Text: %s", original.text)
+    logger.debug("User ID: %s", original.user_id)
+    logger.debug("Timestamp: %s", original.timestamp)
+    logger.debug("Serialized data length: %d chars", len(json_data))
 
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
     assert isinstance(deserialized, TranscriptionFrame)
     assert deserialized.text == original.text
     assert deserialized.user_id == original.user_id
     assert deserialized.timestamp == original.timestamp
     
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Text preserved: {deserialized.text == original.text}")
-    print(f"User ID preserved: {deserialized.user_id == original.user_id}")
-    print(f"Timestamp preserved: {deserialized.timestamp == original.timestamp}")
-    print("=" * 50)
-
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("Text preserved: %s", deserialized.text == original.text)
+    logger.debug("User ID preserved: %s", deserialized.user_id == original.user_id)
+    logger.debug("Timestamp preserved: %s", deserialized.timestamp == original.timestamp)
+    logger.debug("=" * 50)
+
+
+@pytest.mark.parametrize(
+    "frame_class,message",
+    [
+        pytest.param(
+            OutputTransportMessageFrame,
+            {"action": "update", "data": {"key": "value"}},
+            id="transport_message",
+        ),
+        pytest.param(
+            OutputTransportMessageUrgentFrame,
+            {"action": "urgent", "priority": "high"},
+            id="transport_message_urgent",
+        ),
+    ],
+)
+def test_serialize_deserialize_transport_message_frame(serializer, frame_class, message):
+    """Test serialization and deserialization of the transport message frames."""
+    logger.debug(
+        "\n=== Test: test_serialize_deserialize_transport_message_frame[%s] ===", frame_class.__name__
+    )
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_transport_message_frame(serializer):
-    """Test serialization and deserialization of OutputTransportMessageFrame."""
-    print(f"\n=== Test: test_serialize_deserialize_transport_message_frame ===")
-    
-    message = {"action": "update", "data": {"key": "value"}}
-    original = OutputTransportMessageFrame(message=message)
-    json_data = await serializer.serialize(original)
+    original = frame_class(message=message)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
-    
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Message: {original.message}")
-    print(f"Serialized data length: {len(json_data)} chars")
 
-    deserialized = await serializer.deserialize(json_data)
-    assert deserialized is not None
-    assert isinstance(deserialized, OutputTransportMessageFrame)
-    assert deserialized.message == original.message
-    
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Message preserved: {deserialized.message == original.message}")
-    print("=" * 50)
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Message: %s", original.message)
+    logger.debug("Serialized data length: %d chars", len(json_data))
 
-
-@pytest.mark.asyncio
-async def test_serialize_deserialize_transport_message_urgent_frame(serializer):
-    """Test serialization and deserialization of OutputTransportMessageUrgentFrame."""
-    print(f"\n=== Test: test_serialize_deserialize_transport_message_urgent_frame ===")
-    
-    message = {"action": "urgent", "priority": "high"}
-    original = OutputTransportMessageUrgentFrame(message=message)
-    json_data = await serializer.serialize(original)
-    assert json_data is not None
-    
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Message: {original.message}")
-    print(f"Serialized data length: {len(json_data)} chars")
-
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
-    assert isinstance(deserialized, OutputTransportMessageUrgentFrame)
+    assert isinstance(deserialized, frame_class)
     assert deserialized.message == original.message
-    
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Message preserved: {deserialized.message == original.message}")
-    print("=" * 50)
 
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("Message preserved: %s", deserialized.message == original.message)
+    logger.debug("=" * 50)
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_input_text_frame(serializer):
+
+def test_serialize_deserialize_input_text_frame(serializer):
     """Test serialization and deserialization of InputTextRawFrame."""
-    print(f"\n=== Test: test_serialize_deserialize_input_text_frame ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_input_text_frame ===")
     
     original = InputTextRawFrame(text="User input text")
-    json_data = await serializer.serialize(original)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
     
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Text: {original.text}")
-    print(f"Serialized data length: {len(json_data)} chars")
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Text: %s", original.text)
+    logger.debug("Serialized data length: %d chars", len(json_data))
 
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
     assert isinstance(deserialized, InputTextRawFrame)
     assert deserialized.text == original.text
     
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Text preserved: {deserialized.text == original.text}")
-    print("=" * 50)
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("Text preserved: %s", deserialized.text == original.text)
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_user_image_frame(serializer):
+def test_serialize_deserialize_user_image_frame(serializer):
     """Test serialization and deserialization of UserImageRawFrame."""
-    print(f"\n=== Test: test_serialize_deserialize_user_image_frame ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_user_image_frame ===")
     
-    image_data = b"\x00\x01\x02\x03\x04\x05\x06\x07" * 500
+    image_data = _IMAGE_4000
     original = UserImageRawFrame(
         image=image_data,
         size=(640, 480),
@@ -340,98 +299,87 @@ async def test_serialize_deserialize_user_image_frame(serializer):
         text="User image description",
         append_to_context=True,
     )
-    json_data = await serializer.serialize(original)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
     
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Image data length: {len(original.image)} bytes")
-    print(f"Size: {original.size}")
-    print(f"Format: {original.format}")
-    print(f"User ID: {original.user_id}")
-    print(f"Text: {original.text}")
-    print(f"Append to context: {original.append_to_context}")
-    print(f"Serialized data length: {len(json_data)} chars")
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Image data length: %d bytes", len(original.image))
+    logger.debug("Size: %s", original.size)
+    logger.debug("Format: %s", original.format)
+    logger.debug("User ID: %s", original.user_id)
+    logger.debug("Text: %s", original.text)
+    logger.debug("Append to context: %s", original.append_to_context)
+    logger.debug("Serialized data length: %d chars", len(json_data))
 
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
     assert isinstance(deserialized, UserImageRawFrame)
-    assert deserialized.image == original.image
+    assert _digest(deserialized.image) == _IMAGE_4000_DIGEST
     assert deserialized.size == original.size
     assert deserialized.format == original.format
     assert deserialized.user_id == original.user_id
     assert deserialized.text == original.text
     assert deserialized.append_to_context == original.append_to_context
     
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Image data preserved: {deserialized.image == original.image}")
-    print(f"Size preserved: {deserialized.size == original.size}")
-    print(f"Format preserved: {deserialized.format == original.format}")
-    print(f"User ID preserved: {deserialized.user_id == original.user_id}")
-    print(f"Text preserved: {deserialized.text == original.text}")
-    print(f"Append to context preserved: {deserialized.append_to_context == original.append_to_context}")
-    print("=" * 50)
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("Image data preserved: %s", deserialized.image == original.image)
+    logger.debug("Size preserved: %s", deserialized.size == original.size)
+    logger.debug("Format preserved: %s", deserialized.format == original.format)
+    logger.debug("User ID preserved: %s", deserialized.user_id == original.user_id)
+    logger.debug("Text preserved: %s", deserialized.text == original.text)
+    logger.debug("Append to context preserved: %s", deserialized.append_to_context == original.append_to_context)
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_llm_thought_frames(serializer):
+def test_serialize_deserialize_llm_thought_frames(serializer):
     """Test serialization and deserialization of LLM thought frames."""
-    print(f"\n=== Test: test_serialize_deserialize_llm_thought_frames ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_llm_thought_frames ===")
     
     # Test LLMThoughtStartFrame
     start_frame = LLMThoughtStartFrame(
         append_to_context=True,
         llm="openai",
     )
-    json_data = await serializer.serialize(start_frame)
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = _rt(serializer, start_frame)
     assert isinstance(deserialized, LLMThoughtStartFrame)
     assert deserialized.append_to_context == start_frame.append_to_context
     assert deserialized.llm == start_frame.llm
-    print(f"LLMThoughtStartFrame: append_to_context={deserialized.append_to_context}, llm={deserialized.llm}")
+    logger.debug("LLMThoughtStartFrame: append_to_context=%s, llm=%s", deserialized.append_to_context, deserialized.llm)
 
     # Test LLMThoughtTextFrame
     text_frame = LLMThoughtTextFrame(text="Thinking...")
-    json_data = await serializer.serialize(text_frame)
-    deserialized = await serializer.deserialize(json_data)
+    json_data = serializer.serialize_sync(text_frame)
+    deserialized = serializer.deserialize_sync(json_data)
     assert isinstance(deserialized, LLMThoughtTextFrame)
     assert deserialized.text == text_frame.text
-    print(f"LLMThoughtTextFrame: text={deserialized.text}")
+    logger.debug("LLMThoughtTextFrame: text=%s", deserialized.text)
 
     # Test LLMThoughtEndFrame
     end_frame = LLMThoughtEndFrame(signature="sig123")
-    json_data = await serializer.serialize(end_frame)
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = _rt(serializer, end_frame)
     assert isinstance(deserialized, LLMThoughtEndFrame)
     assert deserialized.signature == end_frame.signature
-    print(f"LLMThoughtEndFrame: signature={deserialized.signature}")
-    print("=" * 50)
+    logger.debug("LLMThoughtEndFrame: signature=%s", deserialized.signature)
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_llm_response_frames(serializer):
+def test_serialize_deserialize_llm_response_frames(serializer):
     """Test serialization and deserialization of LLM response frames."""
-    print(f"\n=== Test: test_serialize_deserialize_llm_response_frames ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_llm_response_frames ===")
     
-    # Test LLMFullResponseStartFrame
     start_frame = LLMFullResponseStartFrame()
-    json_data = await serializer.serialize(start_frame)
-    deserialized = await serializer.deserialize(json_data)
-    assert isinstance(deserialized, LLMFullResponseStartFrame)
-    print(f"LLMFullResponseStartFrame: successfully serialized and deserialized")
-
-    # Test LLMFullResponseEndFrame
     end_frame = LLMFullResponseEndFrame()
-    json_data = await serializer.serialize(end_frame)
-    deserialized = await serializer.deserialize(json_data)
-    assert isinstance(deserialized, LLMFullResponseEndFrame)
-    print(f"LLMFullResponseEndFrame: successfully serialized and deserialized")
-    print("=" * 50)
+    deserialized_start, deserialized_end = _rt_many(serializer, [start_frame, end_frame])
+    assert isinstance(deserialized_start, LLMFullResponseStartFrame)
+    logger.debug("LLMFullResponseStartFrame: successfully serialized and deserialized")
+    assert isinstance(deserialized_end, LLMFullResponseEndFrame)
+    logger.debug("LLMFullResponseEndFrame: successfully serialized and deserialized")
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_function_call_frames(serializer):
+def test_serialize_deserialize_function_call_frames(serializer):
     """Test serialization and deserialization of function call frames."""
-    print(f"\n=== Test: test_serialize_deserialize_function_call_frames ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_function_call_frames ===")
     
     # Test FunctionCallsStartedFrame
     function_calls = [
@@ -443,12 +391,11 @@ async def test_serialize_deserialize_function_call_frames(serializer):
         )
     ]
     start_frame = FunctionCallsStartedFrame(function_calls=function_calls)
-    json_data = await serializer.serialize(start_frame)
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = _rt(serializer, start_frame)
     assert isinstance(deserialized, FunctionCallsStartedFrame)
     assert len(deserialized.function_calls) == 1
     assert deserialized.function_calls[0].function_name == "get_weather"
-    print(f"FunctionCallsStartedFrame: function_calls={len(deserialized.function_calls)}, function_name={deserialized.function_calls[0].function_name}")
+    logger.debug("FunctionCallsStartedFrame: function_calls=%d, function_name=%s", len(deserialized.function_calls), deserialized.function_calls[0].function_name)
 
     # Test FunctionCallInProgressFrame
     in_progress_frame = FunctionCallInProgressFrame(
@@ -457,84 +404,61 @@ async def test_serialize_deserialize_function_call_frames(serializer):
         arguments={"location": "New York"},
         cancel_on_interruption=False,
     )
-    json_data = await serializer.serialize(in_progress_frame)
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = _rt(serializer, in_progress_frame)
     assert isinstance(deserialized, FunctionCallInProgressFrame)
     assert deserialized.function_name == in_progress_frame.function_name
     assert deserialized.tool_call_id == in_progress_frame.tool_call_id
-    print(f"FunctionCallInProgressFrame: function_name={deserialized.function_name}, tool_call_id={deserialized.tool_call_id}, cancel_on_interruption={deserialized.cancel_on_interruption}")
-    print("=" * 50)
+    logger.debug("FunctionCallInProgressFrame: function_name=%s, tool_call_id=%s, cancel_on_interruption=%s", deserialized.function_name, deserialized.tool_call_id, deserialized.cancel_on_interruption)
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_tts_frames(serializer):
+def test_serialize_deserialize_tts_frames(serializer):
     """Test serialization and deserialization of TTS frames."""
-    print(f"\n=== Test: test_serialize_deserialize_tts_frames ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_tts_frames ===")
     
-    # Test TTSStartedFrame
     start_frame = TTSStartedFrame()
-    json_data = await serializer.serialize(start_frame)
-    deserialized = await serializer.deserialize(json_data)
-    assert isinstance(deserialized, TTSStartedFrame)
-    print(f"TTSStartedFrame: successfully serialized and deserialized")
-
-    # Test TTSStoppedFrame
     stop_frame = TTSStoppedFrame()
-    json_data = await serializer.serialize(stop_frame)
-    deserialized = await serializer.deserialize(json_data)
-    assert isinstance(deserialized, TTSStoppedFrame)
-    print(f"TTSStoppedFrame: successfully serialized and deserialized")
-    print("=" * 50)
+    deserialized_start, deserialized_stop = _rt_many(serializer, [start_frame, stop_frame])
+    assert isinstance(deserialized_start, TTSStartedFrame)
+    logger.debug("TTSStartedFrame: successfully serialized and deserialized")
+    assert isinstance(deserialized_stop, TTSStoppedFrame)
+    logger.debug("TTSStoppedFrame: successfully serialized and deserialized")
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_bot_frames(serializer):
+def test_serialize_deserialize_bot_frames(serializer):
     """Test serialization and deserialization of bot speaking frames."""
-    print(f"\n=== Test: test_serialize_deserialize_bot_frames ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_bot_frames ===")
     
-    # Test BotStartedSpeakingFrame
     start_frame = BotStartedSpeakingFrame()
-    json_data = await serializer.serialize(start_frame)
-    deserialized = await serializer.deserialize(json_data)
-    assert isinstance(deserialized, BotStartedSpeakingFrame)
-    print(f"BotStartedSpeakingFrame: successfully serialized and deserialized")
-
-    # Test BotStoppedSpeakingFrame
     stop_frame = BotStoppedSpeakingFrame()
-    json_data = await serializer.serialize(stop_frame)
-    deserialized = await serializer.deserialize(json_data)
-    assert isinstance(deserialized, BotStoppedSpeakingFrame)
-    print(f"BotStoppedSpeakingFrame: successfully serialized and deserialized")
-    print("=" * 50)
+    deserialized_start, deserialized_stop = _rt_many(serializer, [start_frame, stop_frame])
+    assert isinstance(deserialized_start, BotStartedSpeakingFrame)
+    logger.debug("BotStartedSpeakingFrame: successfully serialized and deserialized")
+    assert isinstance(deserialized_stop, BotStoppedSpeakingFrame)
+    logger.debug("BotStoppedSpeakingFrame: successfully serialized and deserialized")
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_user_frames(serializer):
+def test_serialize_deserialize_user_frames(serializer):
     """Test serialization and deserialization of user speaking frames."""
-    print(f"\n=== Test: test_serialize_deserialize_user_frames ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_user_frames ===")
     
-    # Test UserStartedSpeakingFrame
     start_frame = UserStartedSpeakingFrame(emulated=True)
-    json_data = await serializer.serialize(start_frame)
-    deserialized = await serializer.deserialize(json_data)
-    assert isinstance(deserialized, UserStartedSpeakingFrame)
-    assert deserialized.emulated == start_frame.emulated
-    print(f"UserStartedSpeakingFrame: emulated={deserialized.emulated}")
-
-    # Test UserStoppedSpeakingFrame
     stop_frame = UserStoppedSpeakingFrame(emulated=False)
-    json_data = await serializer.serialize(stop_frame)
-    deserialized = await serializer.deserialize(json_data)
-    assert isinstance(deserialized, UserStoppedSpeakingFrame)
-    assert deserialized.emulated == stop_frame.emulated
-    print(f"UserStoppedSpeakingFrame: emulated={deserialized.emulated}")
-    print("=" * 50)
+    deserialized_start, deserialized_stop = _rt_many(serializer, [start_frame, stop_frame])
+    assert isinstance(deserialized_start, UserStartedSpeakingFrame)
+    assert deserialized_start.emulated == start_frame.emulated
+    logger.debug("UserStartedSpeakingFrame: emulated=%s", deserialized_start.emulated)
+    assert isinstance(deserialized_stop, UserStoppedSpeakingFrame)
+    assert deserialized_stop.emulated == stop_frame.emulated
+    logger.debug("UserStoppedSpeakingFrame: emulated=%s", deserialized_stop.emulated)
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_control_frames(serializer):
+def test_serialize_deserialize_control_frames(serializer):
     """Test serialization and deserialization of control frames."""
-    print(f"\n=== Test: test_serialize_deserialize_control_frames ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_control_frames ===")
     
     # Test StartFrame
     start_frame = StartFrame(
@@ -542,43 +466,38 @@ async def test_serialize_deserialize_control_frames(serializer):
         audio_out_sample_rate=24000,
         allow_interruptions=True,
     )
-    json_data = await serializer.serialize(start_frame)
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = _rt(serializer, start_frame)
     assert isinstance(deserialized, StartFrame)
     assert deserialized.audio_in_sample_rate == start_frame.audio_in_sample_rate
     assert deserialized.audio_out_sample_rate == start_frame.audio_out_sample_rate
     assert deserialized.allow_interruptions == start_frame.allow_interruptions
-    print(f"StartFrame: audio_in_sample_rate={deserialized.audio_in_sample_rate}, audio_out_sample_rate={deserialized.audio_out_sample_rate}, allow_interruptions={deserialized.allow_interruptions}")
+    logger.debug("StartFrame: audio_in_sample_rate=%s, audio_out_sample_rate=%s, allow_interruptions=%s", deserialized.audio_in_sample_rate, deserialized.audio_out_sample_rate, deserialized.allow_interruptions)
 
     # Test EndFrame
     end_frame = EndFrame(reason="Test completed")
-    json_data = await serializer.serialize(end_frame)
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = _rt(serializer, end_frame)
     assert isinstance(deserialized, EndFrame)
     assert deserialized.reason == end_frame.reason
-    print(f"EndFrame: reason={deserialized.reason}")
+    logger.debug("EndFrame: reason=%s", deserialized.reason)
 
     # Test CancelFrame
     cancel_frame = CancelFrame(reason="Test cancelled")
-    json_data = await serializer.serialize(cancel_frame)
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = _rt(serializer, cancel_frame)
     assert isinstance(deserialized, CancelFrame)
     assert deserialized.reason == cancel_frame.reason
-    print(f"CancelFrame: reason={deserialized.reason}")
+    logger.debug("CancelFrame: reason=%s", deserialized.reason)
 
     # Test InterruptionFrame
     interruption_frame = InterruptionFrame()
-    json_data = await serializer.serialize(interruption_frame)
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = _rt(serializer, interruption_frame)
     assert isinstance(deserialized, InterruptionFrame)
-    print(f"InterruptionFrame: successfully serialized and deserialized")
-    print("=" * 50)
+    logger.debug("InterruptionFrame: successfully serialized and deserialized")
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_metrics_frame(serializer):
+def test_serialize_deserialize_metrics_frame(serializer):
     """Test serialization and deserialization of MetricsFrame."""
-    print(f"\n=== Test: test_serialize_deserialize_metrics_frame ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_metrics_frame ===")
     
     metrics_data = [
         MetricsData(
@@ -587,173 +506,152 @@ async def test_serialize_deserialize_metrics_frame(serializer):
         )
     ]
     original = MetricsFrame(data=metrics_data)
-    json_data = await serializer.serialize(original)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
     
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Number of metrics: {len(original.data)}")
-    print(f"First metric: processor={original.data[0].processor}, model={original.data[0].model}")
-    print(f"Serialized data length: {len(json_data)} chars")
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Number of metrics: %d", len(original.data))
+    logger.debug("First metric: processor=%s, model=%s", original.data[0].processor, original.data[0].model)
+    logger.debug("Serialized data length: %d chars", len(json_data))
 
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
     assert isinstance(deserialized, MetricsFrame)
     assert len(deserialized.data) == len(original.data)
     
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Number of metrics preserved: {len(deserialized.data) == len(original.data)}")
-    print(f"First metric preserved: processor={deserialized.data[0].processor}, model={deserialized.data[0].model}")
-    print("=" * 50)
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("Number of metrics preserved: %s", len(deserialized.data) == len(original.data))
+    logger.debug("First metric preserved: processor=%s, model=%s", deserialized.data[0].processor, deserialized.data[0].model)
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_with_metadata(serializer):
+def test_serialize_with_metadata(serializer):
     """Test serialization with frame metadata."""
-    print(f"\n=== Test: test_serialize_with_metadata ===")
+    logger.debug("\n=== Test: test_serialize_with_metadata ===")
     
     original = TextFrame(text="Test with metadata")
     original.metadata = {"key1": "value1", "key2": 123}
     original.pts = 1234567890
     
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Text: {original.text}")
-    print(f"Metadata: {original.metadata}")
-    print(f"PTS: {original.pts}")
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Text: %s", original.text)
+    logger.debug("Metadata: %s", original.metadata)
+    logger.debug("PTS: %s", original.pts)
 
-    json_data = await serializer.serialize(original)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
     
-    print(f"Serialized data length: {len(json_data)} chars")
+    logger.debug("Serialized data length: %d chars", len(json_data))
 
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
     assert deserialized.metadata == original.metadata
     assert deserialized.pts == original.pts
     
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Metadata preserved: {deserialized.metadata == original.metadata}")
-    print(f"PTS preserved: {deserialized.pts == original.pts}")
-    print("=" * 50)
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("Metadata preserved: %s", deserialized.metadata == original.metadata)
+    logger.debug("PTS preserved: %s", deserialized.pts == original.pts)
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_with_transport_info(serializer):
+def test_serialize_with_transport_info(serializer):
     """Test serialization with transport source and destination."""
-    print(f"\n=== Test: test_serialize_with_transport_info ===")
+    logger.debug("\n=== Test: test_serialize_with_transport_info ===")
     
     original = TextFrame(text="Test with transport info")
     original.transport_source = "input_transport"
     original.transport_destination = "output_transport"
     
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Text: {original.text}")
-    print(f"Transport source: {original.transport_source}")
-    print(f"Transport destination: {original.transport_destination}")
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Text: %s", original.text)
+    logger.debug("Transport source: %s", original.transport_source)
+    logger.debug("Transport destination: %s", original.transport_destination)
 
-    json_data = await serializer.serialize(original)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
     
-    print(f"Serialized data length: {len(json_data)} chars")
+    logger.debug("Serialized data length: %d chars", len(json_data))
 
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
     assert deserialized.transport_source == original.transport_source
     assert deserialized.transport_destination == original.transport_destination
     
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Transport source preserved: {deserialized.transport_source == original.transport_source}")
-    print(f"Transport destination preserved: {deserialized.transport_destination == original.transport_destination}")
-    print("=" * 50)
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("Transport source preserved: %s", deserialized.transport_source == original.transport_source)
+    logger.debug("Transport destination preserved: %s", deserialized.transport_destination == original.transport_destination)
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_none_value(serializer):
+def test_serialize_none_value(serializer):
     """Test serialization returns None for invalid input."""
-    print(f"\n=== Test: test_serialize_none_value ===")
+    logger.debug("\n=== Test: test_serialize_none_value ===")
     
-    result = await serializer.serialize(None)
-    print(f"Input: None")
-    print(f"Result: {result}")
-    print(f"Expected: None")
+    result = serializer.serialize_sync(None)
+    logger.debug("Input: None")
+    logger.debug("Result: %s", result)
+    logger.debug("Expected: None")
     assert result is None
-    print("Test passed: None input returns None")
-    print("=" * 50)
+    logger.debug("Test passed: None input returns None")
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_deserialize_invalid_json(serializer):
+def test_deserialize_invalid_json(serializer):
     """Test deserialization returns None for invalid JSON."""
-    print(f"\n=== Test: test_deserialize_invalid_json ===")
+    logger.debug("\n=== Test: test_deserialize_invalid_json ===")
     
     invalid_json = "{invalid json}"
-    result = await serializer.deserialize(invalid_json)
-    print(f"Input: {invalid_json}")
-    print(f"Result: {result}")
-    print(f"Expected: None")
+    result = serializer.deserialize_sync(invalid_json)
+    logger.debug("Input: %s", invalid_json)
+    logger.debug("Result: %s", result)
+    logger.debug("Expected: None")
     assert result is None
-    print("Test passed: Invalid JSON returns None")
-    print("=" * 50)
+    logger.debug("Test passed: Invalid JSON returns None")
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_deserialize_empty_string(serializer):
+def test_deserialize_empty_string(serializer):
     """Test deserialization returns None for empty string."""
-    print(f"\n=== Test: test_deserialize_empty_string ===")
+    logger.debug("\n=== Test: test_deserialize_empty_string ===")
     
     empty_string = ""
-    result = await serializer.deserialize(empty_string)
-    print(f"Input: '{empty_string}' (empty string)")
-    print(f"Result: {result}")
-    print(f"Expected: None")
+    result = serializer.deserialize_sync(empty_string)
+    logger.debug("Input: '%s' (empty string)", empty_string)
+    logger.debug("Result: %s", result)
+    logger.debug("Expected: None")
     assert result is None
-    print("Test passed: Empty string returns None")
-    print("=" * 50)
+    logger.debug("Test passed: Empty string returns None")
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_complex_nested_message(serializer):
+def test_serialize_complex_nested_message(serializer):
     """Test serialization of complex nested message structures."""
-    print(f"\n=== Test: test_serialize_complex_nested_message ===")
-    
-    complex_message = {
-        "action": "update",
-        "data": {
-            "nested": {
-                "list": [1, 2, 3],
-                "dict": {"key": "value"},
-                "string": "test",
-            }
-        },
-        "metadata": {
-            "timestamp": 1234567890,
-            "tags": ["tag1", "tag2"],
-        },
-    }
-    original = OutputTransportMessageFrame(message=complex_message)
-    json_data = await serializer.serialize(original)
+    logger.debug("\n=== Test: test_serialize_complex_nested_message ===")
+    
+    original = OutputTransportMessageFrame(message=_COMPLEX_MESSAGE)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
     
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Message action: {original.message['action']}")
-    print(f"Message has nested data: {'nested' in original.message['data']}")
-    print(f"Message has metadata: {'metadata' in original.message}")
-    print(f"Serialized data length: {len(json_data)} chars")
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Message action: %s", original.message['action'])
+    logger.debug("Message has nested data: %s", 'nested' in original.message['data'])
+    logger.debug("Message has metadata: %s", 'metadata' in original.message)
+    logger.debug("Serialized data length: %d chars", len(json_data))
 
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
     assert isinstance(deserialized, OutputTransportMessageFrame)
     assert deserialized.message == original.message
     
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Message preserved: {deserialized.message == original.message}")
-    print(f"Complex structure preserved: {deserialized.message['data']['nested']['list'] == [1, 2, 3]}")
-    print("=" * 50)
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("Message preserved: %s", deserialized.message == original.message)
+    logger.debug("Complex structure preserved: %s", deserialized.message['data']['nested']['list'] == [1, 2, 3])
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_roundtrip_preserves_data(serializer):
+def test_roundtrip_preserves_data(serializer):
     """Test that roundtrip serialization preserves all frame data."""
-    print(f"\n=== Test: test_roundtrip_preserves_data ===")
+    logger.debug("\n=== Test: test_roundtrip_preserves_data ===")
     
     test_frames = [
         TextFrame(text="Test text"),
@@ -764,28 +662,27 @@ async def test_roundtrip_preserves_data(serializer):
         EndFrame(reason="Test"),
     ]
     
-    print(f"Testing {len(test_frames)} different frame types for roundtrip serialization...")
+    logger.debug("Testing %d different frame types for roundtrip serialization...", len(test_frames))
 
     for original in test_frames:
-        json_data = await serializer.serialize(original)
+        json_data = serializer.serialize_sync(original)
         assert json_data is not None, f"Failed to serialize {original.__class__.__name__}"
 
-        deserialized = await serializer.deserialize(json_data)
+        deserialized = serializer.deserialize_sync(json_data)
         assert deserialized is not None, f"Failed to deserialize {original.__class__.__name__}"
         assert type(deserialized) == type(original), f"Type mismatch for {original.__class__.__name__}"
         
-        print(f"✓ {original.__class__.__name__}: successfully serialized and deserialized")
+        logger.debug("✓ %s: successfully serialized and deserialized", original.__class__.__name__)
     
-    print(f"All {len(test_frames)} frame types passed roundtrip test")
-    print("=" * 50)
+    logger.debug("All %d frame types passed roundtrip test", len(test_frames))
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_pipecat_frames_no_module_field(serializer):
+def test_pipecat_frames_no_module_field(serializer):
     """Test that frames from pipecat.frames.frames don't serialize module field."""
-    print(f"\n=== Test: test_pipecat_frames_no_module_field ===")
+    logger.debug("\n=== Test: test_pipecat_frames_no_module_field ===")
     
-    import json
+    import orjson
     
     # Test with various pipecat frame types
     test_frames = [
@@ -795,26 +692,27 @@ async def test_pipecat_frames_no_module_field(serializer):
         EndFrame(reason="Test"),
     ]
     
-    print(f"Testing {len(test_frames)} frame types for module field absence...")
+    logger.debug("Testing %d frame types for module field absence...", len(test_frames))
 
     for frame in test_frames:
-        json_data = await serializer.serialize(frame)
-        frame_dict = json.loads(json_data)
+        json_data = serializer.serialize_sync(frame)
+        frame_dict = orjson.loads(json_data)
         
         # Verify that pipecat.frames.frames frames don't have module field
         assert "module" not in frame_dict, f"{frame.__class__.__name__} should not have module field"
         assert "___type___" in frame_dict, f"{frame.__class__.__name__} should have ___type___ field"
         
-        print(f"✓ {frame.__class__.__name__}: module field absent, ___type___ field present")
+        logger.debug("✓ %s: module field absent, ___type___ field present", frame.__class__.__name__)
     
-    print(f"All {len(test_frames)} frame types verified correctly")
-    print("=" * 50)
+    logger.debug("All %d frame types verified correctly", len(test_frames))
+    logger.debug("=" * 50)
 
 
 # Define custom frame classes at module level for deserialization tests
 from dataclasses import dataclass, field
 from pipecat.frames.frames import Frame
 
+@register_frame_class
 @dataclass
 class CustomStatusFrame(Frame):
     """Custom frame type for status updates."""
@@ -823,6 +721,7 @@ class CustomStatusFrame(Frame):
     metadata: dict = None
     timestamp: int = None
 
+@register_frame_class
 @dataclass
 class CustomDataFrame(Frame):
     """Custom frame type for binary data."""
@@ -830,6 +729,7 @@ class CustomDataFrame(Frame):
     data: bytes = None
     checksum: str = None
 
+@register_frame_class
 @dataclass
 class NestedConfig:
     """Nested configuration object."""
@@ -837,6 +737,7 @@ class NestedConfig:
     setting2: int = None
     enabled: bool = None
 
+@register_frame_class
 @dataclass
 class CustomConfigFrame(Frame):
     """Custom frame type with nested configuration."""
@@ -844,11 +745,16 @@ class CustomConfigFrame(Frame):
     config: NestedConfig = None
     tags: list = None
 
+@register_frame_class
+@dataclass
+class CustomSamplesFrame(Frame):
+    """Custom frame type carrying a float sequence."""
+    samples: list = None
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_custom_frame_type(serializer):
+
+def test_serialize_deserialize_custom_frame_type(serializer):
     """Test serialization and deserialization of custom frame types."""
-    print(f"\n=== Test: test_serialize_deserialize_custom_frame_type ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_custom_frame_type ===")
     
     # Create an instance of the custom frame
     original = CustomStatusFrame(
@@ -858,32 +764,32 @@ async def test_serialize_deserialize_custom_frame_type(serializer):
         timestamp=1234567890,
     )
     
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Module: {original.__class__.__module__}")
-    print(f"Status: {original.status}")
-    print(f"Progress: {original.progress}")
-    print(f"Metadata: {original.metadata}")
-    print(f"Timestamp: {original.timestamp}")
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Module: %s", original.__class__.__module__)
+    logger.debug("Status: %s", original.status)
+    logger.debug("Progress: %s", original.progress)
+    logger.debug("Metadata: %s", original.metadata)
+    logger.debug("Timestamp: %s", original.timestamp)
     
     # Serialize the custom frame
-    json_data = await serializer.serialize(original)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
     
-    print(f"Serialized data length: {len(json_data)} chars")
+    logger.debug("Serialized data length: %d chars", len(json_data))
     
     # Verify that the module field is present for custom frames
-    import json
-    frame_dict = json.loads(json_data)
+    import orjson
+    frame_dict = orjson.loads(json_data)
     assert "module" in frame_dict, "Custom frames should have module field"
     assert "___type___" in frame_dict, "Custom frames should have ___type___ field"
     assert frame_dict["module"] == __name__, f"Module should be {__name__}"
     assert frame_dict["___type___"] == "CustomStatusFrame", "Type should be CustomStatusFrame"
     
-    print(f"Module field present: {frame_dict.get('module')}")
-    print(f"Type field present: {frame_dict.get('___type___')}")
+    logger.debug("Module field present: %s", frame_dict.get('module'))
+    logger.debug("Type field present: %s", frame_dict.get('___type___'))
     
     # Deserialize the custom frame
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
     assert isinstance(deserialized, CustomStatusFrame)
     assert deserialized.status == original.status
@@ -891,19 +797,18 @@ async def test_serialize_deserialize_custom_frame_type(serializer):
     assert deserialized.metadata == original.metadata
     assert deserialized.timestamp == original.timestamp
     
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Module: {deserialized.__class__.__module__}")
-    print(f"Status preserved: {deserialized.status == original.status}")
-    print(f"Progress preserved: {deserialized.progress == original.progress}")
-    print(f"Metadata preserved: {deserialized.metadata == original.metadata}")
-    print(f"Timestamp preserved: {deserialized.timestamp == original.timestamp}")
-    print("=" * 50)
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("Module: %s", deserialized.__class__.__module__)
+    logger.debug("Status preserved: %s", deserialized.status == original.status)
+    logger.debug("Progress preserved: %s", deserialized.progress == original.progress)
+    logger.debug("Metadata preserved: %s", deserialized.metadata == original.metadata)
+    logger.debug("Timestamp preserved: %s", deserialized.timestamp == original.timestamp)
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_custom_frame_with_bytes(serializer):
+def test_serialize_deserialize_custom_frame_with_bytes(serializer):
     """Test serialization and deserialization of custom frame types with bytes data."""
-    print(f"\n=== Test: test_serialize_deserialize_custom_frame_with_bytes ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_custom_frame_with_bytes ===")
     
     # Create an instance with binary data
     binary_data = b"\x00\x01\x02\x03\x04\x05\x06\x07" * 100
@@ -913,36 +818,35 @@ async def test_serialize_deserialize_custom_frame_with_bytes(serializer):
         checksum="abc123",
     )
     
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Name: {original.name}")
-    print(f"Data length: {len(original.data)} bytes")
-    print(f"Checksum: {original.checksum}")
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Name: %s", original.name)
+    logger.debug("Data length: %d bytes", len(original.data))
+    logger.debug("Checksum: %s", original.checksum)
     
     # Serialize
-    json_data = await serializer.serialize(original)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
     
-    print(f"Serialized data length: {len(json_data)} chars")
+    logger.debug("Serialized data length: %d chars", len(json_data))
     
     # Deserialize
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
     assert isinstance(deserialized, CustomDataFrame)
     assert deserialized.name == original.name
     assert deserialized.data == original.data
     assert deserialized.checksum == original.checksum
     
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Name preserved: {deserialized.name == original.name}")
-    print(f"Data preserved: {deserialized.data == original.data} ({len(deserialized.data)} bytes)")
-    print(f"Checksum preserved: {deserialized.checksum == original.checksum}")
-    print("=" * 50)
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("Name preserved: %s", deserialized.name == original.name)
+    logger.debug("Data preserved: %s (%d bytes)", deserialized.data == original.data, len(deserialized.data))
+    logger.debug("Checksum preserved: %s", deserialized.checksum == original.checksum)
+    logger.debug("=" * 50)
 
 
-@pytest.mark.asyncio
-async def test_serialize_deserialize_custom_frame_with_nested_objects(serializer):
+def test_serialize_deserialize_custom_frame_with_nested_objects(serializer):
     """Test serialization and deserialization of custom frame types with nested objects."""
-    print(f"\n=== Test: test_serialize_deserialize_custom_frame_with_nested_objects ===")
+    logger.debug("\n=== Test: test_serialize_deserialize_custom_frame_with_nested_objects ===")
     
     # Create nested configuration
     nested_config = NestedConfig(
@@ -957,19 +861,19 @@ async def test_serialize_deserialize_custom_frame_with_nested_objects(serializer
         tags=["tag1", "tag2", "tag3"],
     )
     
-    print(f"Original frame: {original.__class__.__name__}")
-    print(f"Config name: {original.config_name}")
-    print(f"Nested config: setting1={original.config.setting1}, setting2={original.config.setting2}, enabled={original.config.enabled}")
-    print(f"Tags: {original.tags}")
+    logger.debug("Original frame: %s", original.__class__.__name__)
+    logger.debug("Config name: %s", original.config_name)
+    logger.debug("Nested config: setting1=%s, setting2=%s, enabled=%s", original.config.setting1, original.config.setting2, original.config.enabled)
+    logger.debug("Tags: %s", original.tags)
     
     # Serialize
-    json_data = await serializer.serialize(original)
+    json_data = serializer.serialize_sync(original)
     assert json_data is not None
     
-    print(f"Serialized data length: {len(json_data)} chars")
+    logger.debug("Serialized data length: %d chars", len(json_data))
     
     # Deserialize
-    deserialized = await serializer.deserialize(json_data)
+    deserialized = serializer.deserialize_sync(json_data)
     assert deserialized is not None
     assert isinstance(deserialized, CustomConfigFrame)
     assert deserialized.config_name == original.config_name
@@ -979,11 +883,274 @@ async def test_serialize_deserialize_custom_frame_with_nested_objects(serializer
     assert deserialized.config.enabled == original.config.enabled
     assert deserialized.tags == original.tags
     
-    print(f"Deserialized frame: {deserialized.__class__.__name__}")
-    print(f"Config name preserved: {deserialized.config_name == original.config_name}")
-    print(f"Nested config preserved: {deserialized.config.setting1 == original.config.setting1}")
-    print(f"Tags preserved: {deserialized.tags == original.tags}")
-    print("=" * 50)
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("Config name preserved: %s", deserialized.config_name == original.config_name)
+    logger.debug("Nested config preserved: %s", deserialized.config.setting1 == original.config.setting1)
+    logger.debug("Tags preserved: %s", deserialized.tags == original.tags)
+    logger.debug("=" * 50)
+
+
+def test_float_list_packed_as_array(serializer):
+    """Test that a list of 64+ floats is packed as a float64 buffer and roundtrips."""
+    import orjson
+
+    logger.debug("\n=== Test: test_float_list_packed_as_array ===")
+    samples = [i / 3 for i in range(64)] + [float("nan"), float("inf"), -0.0]
+    original = CustomSamplesFrame(samples=samples)
+
+    json_data = serializer.serialize_sync(original)
+    frame_dict = orjson.loads(json_data)
+    assert frame_dict["__array_fields__"] == {"samples": "d"}
+    assert isinstance(frame_dict["samples"], str)
+
+    deserialized = serializer.deserialize_sync(json_data)
+    assert isinstance(deserialized.samples, list)
+    assert deserialized.samples[:64] == samples[:64]
+    assert math.isnan(deserialized.samples[64])
+    assert deserialized.samples[65] == float("inf")
+    assert math.copysign(1.0, deserialized.samples[66]) == -1.0
+    logger.debug("=" * 50)
+
+
+def test_float_tuple_packed_as_array(serializer):
+    """Test that a packed float tuple comes back as a tuple."""
+    logger.debug("\n=== Test: test_float_tuple_packed_as_array ===")
+    original = CustomSamplesFrame(samples=tuple(float(i) for i in range(100)))
+
+    deserialized = _rt(serializer, original)
+    assert isinstance(deserialized.samples, tuple)
+    assert deserialized.samples == original.samples
+    logger.debug("=" * 50)
+
+
+def test_msgpack_float_list_packed_as_array(msgpack_serializer):
+    """Test that the MessagePack serializer packs float lists as raw bytes."""
+    import msgpack
+
+    logger.debug("\n=== Test: test_msgpack_float_list_packed_as_array ===")
+    samples = [i * 0.25 for i in range(128)]
+    original = CustomSamplesFrame(samples=samples)
+
+    data = msgpack_serializer.serialize_sync(original)
+    frame_dict = msgpack.unpackb(data)
+    assert frame_dict["__array_fields__"] == {"samples": "d"}
+    assert frame_dict["samples"] == b"".join(struct.pack("<d", value) for value in samples)
+
+    deserialized = msgpack_serializer.deserialize_sync(data)
+    assert deserialized.samples == samples
+    logger.debug("=" * 50)
+
+
+def test_short_float_list_stays_json(serializer):
+    """Test that a float list under 64 items stays a JSON array, NaN and inf becoming null."""
+    import orjson
+
+    logger.debug("\n=== Test: test_short_float_list_stays_json ===")
+    samples = [float(i) for i in range(61)] + [float("nan"), float("inf")]
+    original = CustomSamplesFrame(samples=samples)
+
+    json_data = serializer.serialize_sync(original)
+    frame_dict = orjson.loads(json_data)
+    assert "__array_fields__" not in frame_dict
+    assert isinstance(frame_dict["samples"], list)
+
+    deserialized = serializer.deserialize_sync(json_data)
+    assert deserialized.samples == samples[:61] + [None, None]
+    logger.debug("=" * 50)
+
+
+def test_deserialize_rejects_unknown_array_typecode(serializer):
+    """Test that an __array_fields__ typecode other than 'd' is refused."""
+    import orjson
+
+    logger.debug("\n=== Test: test_deserialize_rejects_unknown_array_typecode ===")
+    json_data = serializer.serialize_sync(CustomSamplesFrame(samples=[1.0] * 64))
+    frame_dict = orjson.loads(json_data)
+    frame_dict["__array_fields__"] = {"samples": "u"}
+
+    assert serializer.deserialize_sync(orjson.dumps(frame_dict).decode()) is None
+    logger.debug("=" * 50)
+
+
+@pytest.mark.parametrize(
+    "frame_dict",
+    [
+        {"___frame___": "Zzz", "module": "this"},
+        {"___frame___": "PosixPath", "module": "pathlib"},
+        {"___frame___": "CustomStatusFrame", "module": "jarvis.unregistered"},
+    ],
+)
+def test_deserialize_rejects_unregistered_module(serializer, frame_dict):
+    """Test that a frame dict naming an unregistered module is dropped, not imported."""
+    import sys
+
+    import orjson
+
+    logger.debug("\n=== Test: test_deserialize_rejects_unregistered_module ===")
+    was_loaded = frame_dict["module"] in sys.modules
+
+    assert serializer.deserialize_sync(orjson.dumps(frame_dict).decode()) is None
+    assert (frame_dict["module"] in sys.modules) == was_loaded
+    logger.debug("=" * 50)
+
+
+def test_deserialize_rejects_non_frame_names(serializer):
+    """Test that names in pipecat.frames.frames outside the frame registry are dropped."""
+    logger.debug("\n=== Test: test_deserialize_rejects_non_frame_names ===")
+
+    for type_name in ("logger", "Optional", "NotAFrame"):
+        assert serializer.deserialize_sync(f'{{"___frame___": "{type_name}"}}') is None
+    logger.debug("=" * 50)
+
+
+def test_serialize_deserialize_batch(serializer):
+    """Test that a batch of frames roundtrips through a single JSON array."""
+    logger.debug("\n=== Test: test_serialize_deserialize_batch ===")
+
+    frames = [
+        TextFrame(text="first"),
+        TranscriptionFrame(text="second", user_id="user", timestamp="2024-01-01T00:00:00"),
+        InputImageRawFrame(image=b"\x00\x01" * 8, size=(4, 4), format="RGB"),
+    ]
+    json_data = serializer.serialize_batch_sync(frames)
+    assert json_data is not None
+    assert json_data.startswith("[")
+
+    logger.debug("Serialized %d frames into %d chars", len(frames), len(json_data))
+
+    deserialized = serializer.deserialize_batch_sync(json_data)
+    assert [f.__class__ for f in deserialized] == [f.__class__ for f in frames]
+    assert [f.id for f in deserialized] == [f.id for f in frames]
+    assert deserialized[0].text == "first"
+    assert deserialized[1].user_id == "user"
+    assert deserialized[2].image == frames[2].image
+    assert deserialized[2].size == (4, 4)
+    logger.debug("=" * 50)
+
+
+@pytest.mark.asyncio
+async def test_async_methods_match_sync(serializer, msgpack_serializer):
+    """Test that the async FrameSerializer methods produce the same output as the sync ones."""
+    logger.debug("\n=== Test: test_async_methods_match_sync ===")
+
+    frames = [TextFrame(text="async"), InputImageRawFrame(image=b"\x00\x01", size=(1, 1), format="RGB")]
+    for s in (serializer, msgpack_serializer):
+        data = await s.serialize(frames[0])
+        assert data == s.serialize_sync(frames[0])
+        deserialized = await s.deserialize(data)
+        assert isinstance(deserialized, TextFrame)
+        assert deserialized.text == "async"
+
+        batch = await s.serialize_batch(frames)
+        assert batch == s.serialize_batch_sync(frames)
+        assert [f.__class__ for f in await s.deserialize_batch(batch)] == [
+            TextFrame,
+            InputImageRawFrame,
+        ]
+        logger.debug("%s: async and sync outputs match", s.__class__.__name__)
+    logger.debug("=" * 50)
+
+
+def test_msgpack_serializer_type(msgpack_serializer):
+    """Test that the MessagePack serializer returns binary type."""
+    from pipecat.serializers.base_serializer import FrameSerializerType
+
+    logger.debug("\n=== Test: test_msgpack_serializer_type ===")
+    logger.debug("Serializer type: %s", msgpack_serializer.type)
+    logger.debug("=" * 50)
+
+    assert msgpack_serializer.type == FrameSerializerType.BINARY
+
+
+def test_msgpack_serialize_deserialize_text_frame(msgpack_serializer):
+    """Test MessagePack serialization and deserialization of TextFrame."""
+    logger.debug("\n=== Test: test_msgpack_serialize_deserialize_text_frame ===")
+
+    original = TextFrame(text="Hello, World!")
+    data = msgpack_serializer.serialize_sync(original)
+    assert isinstance(data, bytes)
+
+    logger.debug("Serialized data length: %d bytes", len(data))
+
+    deserialized = msgpack_serializer.deserialize_sync(data)
+    assert isinstance(deserialized, TextFrame)
+    assert deserialized.text == original.text
+    assert deserialized.id == original.id
+    assert deserialized.name == original.name
+
+    logger.debug("Deserialized frame: %s", deserialized.__class__.__name__)
+    logger.debug("=" * 50)
+
+
+def test_msgpack_keeps_bytes_raw(msgpack_serializer):
+    """Test that MessagePack sends bytes fields without base64 or markers."""
+    import msgpack
+
+    logger.debug("\n=== Test: test_msgpack_keeps_bytes_raw ===")
+
+    image_data = b"\x00\x01\x02\x03" * 100
+    original = InputImageRawFrame(image=image_data, size=(10, 10), format="RGB")
+    data = msgpack_serializer.serialize_sync(original)
+    assert data is not None
+
+    frame_dict = msgpack.unpackb(data, raw=False)
+    logger.debug("Serialized keys: %s", sorted(frame_dict))
+    assert frame_dict["image"] == image_data
+    assert "__bytes_fields__" not in frame_dict
+    assert frame_dict["__tuple_fields__"] == ["size"]
+
+    deserialized = msgpack_serializer.deserialize_sync(data)
+    assert isinstance(deserialized, InputImageRawFrame)
+    assert deserialized.image == original.image
+    assert deserialized.size == original.size
+    assert deserialized.format == original.format
+    logger.debug("=" * 50)
+
+
+def test_msgpack_binary_payload_frames(msgpack_serializer):
+    """Test that audio and image payloads roundtrip as raw bytes with MessagePack."""
+    import msgpack
+    from pipecat.frames.frames import AudioRawFrame
+
+    logger.debug("\n=== Test: test_msgpack_binary_payload_frames ===")
+
+    audio_data = _AUDIO_800
+    audio = OutputAudioRawFrame(audio=audio_data, sample_rate=24000, num_channels=1)
+    data = msgpack_serializer.serialize_sync(audio)
+    assert msgpack.unpackb(data, raw=False)["audio"] == audio_data
+    # Raw bytes plus a small header, no base64 inflation
+    assert len(data) < len(audio_data) + 64
+
+    deserialized = msgpack_serializer.deserialize_sync(data)
+    assert isinstance(deserialized, AudioRawFrame)
+    assert _digest(deserialized.audio) == _AUDIO_800_DIGEST
+    assert deserialized.sample_rate == 24000
+
+    image_data = b"\xFF\x00\x00" * 500
+    image = UserImageRawFrame(
+        user_id="user", image=image_data, size=(25, 20), format="RGB", text="look"
+    )
+    data = msgpack_serializer.serialize_sync(image)
+    assert len(data) < len(image_data) + 256
+
+    deserialized = msgpack_serializer.deserialize_sync(data)
+    assert isinstance(deserialized, UserImageRawFrame)
+    assert deserialized.image == image_data
+    assert deserialized.size == (25, 20)
+    assert deserialized.user_id == "user"
+    assert deserialized.text == "look"
+
+    logger.debug("Serialized image frame: %d bytes for %d bytes of image", len(data), len(image_data))
+    logger.debug("=" * 50)
+
+
+def test_msgpack_deserialize_invalid_data(msgpack_serializer):
+    """Test that invalid MessagePack data returns None."""
+    logger.debug("\n=== Test: test_msgpack_deserialize_invalid_data ===")
+
+    assert msgpack_serializer.deserialize_sync(b"\xc1") is None
+    assert msgpack_serializer.deserialize_sync(b"") is None
+    logger.debug("=" * 50)
 
 
 if __name__ == "__main__":
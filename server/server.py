@@ -10,10 +10,22 @@ from typing import TypedDict
 from loguru import logger
 from fastapi import FastAPI, BackgroundTasks, Request, WebSocket
 import uvicorn
-import uuid
 
 load_dotenv(override=True)
 
+
+def configure_logging():
+    """Log to stderr at $LOG_LEVEL (default DEBUG).
+
+    Runs at import so that worker processes, which import server:app instead of
+    running __main__, pick up the same level from the environment they inherit.
+    """
+    logger.remove()
+    logger.add(sys.stderr, level=os.getenv("LOG_LEVEL", "DEBUG"))
+
+
+configure_logging()
+
 # Read trusted hosts from environment variable
 trusted_hosts_env = os.getenv("TRUSTED_HOSTS", "localhost,127.0.0.1")
 trusted_hosts = [host.strip() for host in trusted_hosts_env.split(",") if host.strip()]
@@ -29,8 +41,11 @@ async def start(request: Request):
         return {
             'wsUrl': f'{scheme}://{forwarded_host}/agent'
         }
+    # Same URL request.url_for('agent') would give, without the router lookup
+    scheme = 'wss' if request.url.scheme == 'https' else 'ws'
+    root_path = request.scope.get('root_path', '').rstrip('/')
     return {
-        'wsUrl': str(request.url_for('agent'))
+        'wsUrl': f'{scheme}://{request.url.netloc}{root_path}{AGENT_PATH}'
     }
 
 @app.websocket('/agent', name='agent')
@@ -42,6 +57,9 @@ async def agent_endpoint(websocket: WebSocket):
     except Exception as e:
         print(f"Exception in run_bot: {e}")
 
+# Resolved once; /start only needs to prefix the request's scheme and host
+AGENT_PATH = app.url_path_for('agent')
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     yield
@@ -54,13 +72,33 @@ if __name__ == "__main__":
     parser.add_argument(
         "--port", type=int, default=7860, help="Port for HTTP server (default: 7860)"
     )
-    parser.add_argument("--verbose", "-v", action="count")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WORKERS", "1")),
+        help="Number of worker processes (default: $WORKERS or 1); "
+        "workers import server:app from this file's directory",
+    )
+    parser.add_argument(
+        "--verbose", "-v", action="count", help="Log at TRACE level (sets $LOG_LEVEL)"
+    )
     args = parser.parse_args()
 
-    logger.remove(0)
     if args.verbose:
-        logger.add(sys.stderr, level="TRACE")
-    else:
-        logger.add(sys.stderr, level="DEBUG")
+        # Set in the environment so spawned workers inherit it
+        os.environ["LOG_LEVEL"] = "TRACE"
+        configure_logging()
 
-    uvicorn.run(app, host=args.host, port=args.port)
\ No newline at end of file
+    # uvicorn[standard] (pulled in by pipecat) makes the default "auto" loop and
+    # HTTP parser resolve to uvloop and httptools where available. Each websocket
+    # session runs its own bot, so workers share no state; uvicorn needs an
+    # import string to spawn them. The import string is resolved against
+    # app_dir, which is pinned to this file's directory rather than the working
+    # directory, so the server can be started from anywhere.
+    uvicorn.run(
+        "server:app" if args.workers > 1 else app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+    )
\ No newline at end of file